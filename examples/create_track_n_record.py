@@ -1,16 +1,15 @@
 import reapy
 import time
 
-project = reapy.Project()
-project.add_track(name="Test Track")
-
-tracks = project.tracks
+RECORD_DURATION = 5  # seconds
 
-current_track = tracks[0]
-
-current_track.recarm_change(1)
-current_track.set_info_value("I_RECINPUT", 1) # 0 based index
+project = reapy.Project()
+# Name, arm and set input (0 based index) of the track in one call.
+project.add_track(name="Test Track", rec_arm=True, rec_input=1)
 
 project.current_surface_record()
-time.sleep(5)
-project.current_surface_stop()
\ No newline at end of file
+# Stop early if recording is stopped from REAPER.
+start = time.monotonic()
+while time.monotonic() - start < RECORD_DURATION and project.is_recording:
+    time.sleep(0.05)
+project.current_surface_stop()
@@ -44,6 +44,7 @@ __all__ = [
     "TimeSelection",
     # core.track
     "AutomationItem",
+    "AutomationItemList",
     "Send",
     "Track",
     "TrackList",
@@ -5,7 +5,10 @@ from .envelope import Envelope, EnvelopeList
 from .fx import FX, FXList, FXParam, FXParamsList
 from .item import CC, CCList, Item, Note, NoteList, Source, Take
 from .project import Marker, Project, Region, TimeSelection, Commands
-from .track import AutomationItem, MediaInfo, Send, Track, TrackList, TrackSendInfo
+from .track import (
+    AutomationItem, AutomationItemList, MediaInfo, Send, Track, TrackList,
+    TrackSendInfo
+)
 from .window import MIDIEditor, ToolTip, Window
 
 
@@ -39,6 +42,7 @@ __all__ = [
     "TimeSelection",
     # core.track
     "AutomationItem",
+    "AutomationItemList",
     "MediaInfo",
     "Send",
     "Track",
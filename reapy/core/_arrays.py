@@ -0,0 +1,12 @@
+"""
+Conversion of values received from REAPER to ``numpy`` arrays.
+
+``numpy`` is only imported once an array is actually requested, since
+it is an optional dependency.
+"""
+
+
+def as_float_array(values):
+    """Convert values received from REAPER to a float64 array."""
+    import numpy as np
+    return np.array(values, dtype=np.float64)
@@ -0,0 +1,6 @@
+import typing as ty
+
+
+def as_float_array(values: ty.Sequence[ty.Any]) -> ty.Any:
+    """Convert values received from REAPER to a float64 array."""
+    ...
@@ -0,0 +1,92 @@
+"""
+Local linear resampling of envelope points.
+
+The interpolation kernel is compiled with ``numba`` when it is
+installed, and runs as plain Python otherwise. ``numba`` is only
+imported on first call to :func:`resample_linear`, so that importing
+reapy does not pay for it.
+"""
+
+# Set on first call to resample_linear.
+_kernel = None
+_np = None
+
+
+def _resample_linear(xs, ys, out_xs, out_ys):
+    """
+    Fill `out_ys` with `ys` linearly interpolated at `out_xs`.
+
+    `xs` must be sorted and not empty. Values outside of `xs` range are
+    clamped, as with ``numpy.interp``.
+    """
+    n = len(xs)
+    j = 0
+    for i in range(len(out_xs)):
+        x = out_xs[i]
+        if x <= xs[0]:
+            out_ys[i] = ys[0]
+            continue
+        if x >= xs[n - 1]:
+            out_ys[i] = ys[n - 1]
+            continue
+        # Walk from previous position, which is fast for sorted `out_xs`.
+        while xs[j] >= x:
+            j -= 1
+        while xs[j + 1] < x:
+            j += 1
+        x0, x1 = xs[j], xs[j + 1]
+        out_ys[i] = ys[j] + (ys[j + 1] - ys[j]) * (x - x0) / (x1 - x0)
+
+
+def _load_kernel():
+    """Set interpolation kernel, compiled with numba if possible."""
+    global _kernel, _np
+    try:
+        import numba
+        import numpy
+    except ImportError:
+        _kernel = _resample_linear
+        return
+    _kernel = numba.njit(cache=True, fastmath=True)(_resample_linear)
+    _np = numpy
+
+
+def resample_linear(xs, ys, out_xs):
+    """
+    Linearly interpolate points `(xs, ys)` at `out_xs`.
+
+    Parameters
+    ----------
+    xs : list of float
+        Sorted point times.
+    ys : list of float
+        Point values.
+    out_xs : list of float
+        Times at which to interpolate.
+
+    Returns
+    -------
+    out_ys : list of float
+        Interpolated values.
+
+    Raises
+    ------
+    ValueError
+        If `xs` is empty.
+    """
+    if not len(xs):
+        raise ValueError("Can't resample empty points.")
+    if _kernel is None:
+        _load_kernel()
+    if _np is None:
+        out_ys = [0.] * len(out_xs)
+        _kernel(xs, ys, out_xs, out_ys)
+        return out_ys
+    out_xs = _np.asarray(out_xs, dtype=_np.float64)
+    out_ys = _np.empty_like(out_xs)
+    _kernel(
+        _np.asarray(xs, dtype=_np.float64),
+        _np.asarray(ys, dtype=_np.float64),
+        out_xs, out_ys
+    )
+    return out_ys.tolist()
@@ -0,0 +1,51 @@
+import typing as ty
+
+
+def _resample_linear(
+    xs: ty.Sequence[float],
+    ys: ty.Sequence[float],
+    out_xs: ty.Sequence[float],
+    out_ys: ty.MutableSequence[float]
+) -> None:
+    """
+    Fill `out_ys` with `ys` linearly interpolated at `out_xs`.
+
+    `xs` must be sorted and not empty. Values outside of `xs` range are
+    clamped, as with ``numpy.interp``.
+    """
+    ...
+
+
+def _load_kernel() -> None:
+    """Set interpolation kernel, compiled with numba if possible."""
+    ...
+
+
+def resample_linear(
+    xs: ty.Sequence[float],
+    ys: ty.Sequence[float],
+    out_xs: ty.Sequence[float]
+) -> ty.List[float]:
+    """
+    Linearly interpolate points `(xs, ys)` at `out_xs`.
+
+    Parameters
+    ----------
+    xs : list of float
+        Sorted point times.
+    ys : list of float
+        Point values.
+    out_xs : list of float
+        Times at which to interpolate.
+
+    Returns
+    -------
+    out_ys : list of float
+        Interpolated values.
+
+    Raises
+    ------
+    ValueError
+        If `xs` is empty.
+    """
+    ...
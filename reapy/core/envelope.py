@@ -1,10 +1,44 @@
-from lib2to3.pgen2.token import OP
-import warnings
+import bisect
+import functools
+import itertools
 from typing import Optional
 
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, _arrays, _resample
+
+
+# Formatted values are short strings such as "-6.02dB" or "51%R", so a
+# small output buffer is enough and cheaper to allocate and marshal
+# than the usual 2048 bytes in batched calls.
+_FORMAT_BUFFER_SIZE = 256
+
+# Defaults of Envelope.insert_envelope_point for value, shape, tension
+# and selected.
+_POINT_DEFAULTS = (0.0, 0, 0.0, True)
+
+# Batchable methods that do not change point times, and thus keep the
+# local index of point times valid.
+_KEEP_POINT_TIMES = frozenset(("set_point_at_time",))
+
+
+def _batchable(method):
+    """
+    Make an Envelope method queue its calls during Envelope.batch.
+
+    Unless the method is in ``_KEEP_POINT_TIMES``, calling it also
+    invalidates the local index of point times.
+    """
+    keeps_point_times = method.__name__ in _KEEP_POINT_TIMES
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not keeps_point_times:
+            self._point_times = None
+        if self._pending is None:
+            return method(self, *args, **kwargs)
+        self._pending.append((method.__name__, args, kwargs))
+    return wrapper
 
 
 class Envelope(ReapyObject):
@@ -12,11 +46,146 @@ class Envelope(ReapyObject):
     def __init__(self, parent, id):
         self.id = id
         self._parent = parent
+        self._name = None
+        self._project_id = None
+        self._pending = None
+        self._point_times = None
 
     @property
     def _args(self):
         return (self.parent, self.id)
 
+    @reapy.inside_reaper()
+    def _apply_operations(self, operations):
+        """Apply operations queued during Envelope.batch."""
+        for method_name, args, kwargs in operations:
+            getattr(self, method_name)(*args, **kwargs)
+
+    def _format_value(self, value):
+        """Return human-readable version of a raw envelope value."""
+        return RPR.Envelope_FormatValue(
+            self.id, value, "", _FORMAT_BUFFER_SIZE
+        )[2]
+
+    @reapy.inside_reaper()
+    def _get_derivatives_batch(self, times, raw):
+        """Return derivatives at several times in one distant call."""
+        return [self.get_derivatives(time, raw) for time in times]
+
+    def _get_point(self, ptidx, autoitem_idx=None):
+        """
+        Return (time, value, shape, tension, selected) of a point.
+
+        The point is read from the underlying envelope if
+        `autoitem_idx` is None, and from an automation item otherwise.
+        """
+        if autoitem_idx is None:
+            return RPR.GetEnvelopePoint(self.id, ptidx, 0, 0, 0, 0, 0)[3:]
+        return RPR.GetEnvelopePointEx(
+            self.id, autoitem_idx, ptidx, 0, 0, 0, 0, 0
+        )[4:]
+
+    def _get_point_times(self):
+        """
+        Return point times, from the local index if it is valid.
+
+        During Envelope.batch, times are not stored in the local index
+        since queued edits are not applied yet.
+        """
+        if self._point_times is not None:
+            return self._point_times
+        point_times = self._get_points()[0]
+        if self._pending is None:
+            self._point_times = point_times
+        return point_times
+
+    @reapy.inside_reaper()
+    def _get_points(self):
+        """Return times and values of all envelope points."""
+        points = [
+            RPR.GetEnvelopePoint(self.id, i, 0, 0, 0, 0, 0)
+            for i in range(self.n_points)
+        ]
+        return [p[3] for p in points], [p[4] for p in points]
+
+    @reapy.inside_reaper()
+    def _get_values(self, times, raw):
+        """Return values at several times in one distant call."""
+        return [self.get_value(time, raw) for time in times]
+
+    @_batchable
+    @reapy.inside_reaper()
+    def _insert_envelope_points(self, autoitem_idx, points, sort):
+        """
+        Insert several complete points in one distant call.
+
+        Points are inserted in the underlying envelope if
+        `autoitem_idx` is None, and in an automation item otherwise.
+        """
+        if autoitem_idx is None:
+            for point in points:
+                RPR.InsertEnvelopePoint(self.id, *point, True)
+        else:
+            for point in points:
+                RPR.InsertEnvelopePointEx(self.id, autoitem_idx, *point, True)
+        if sort:
+            if autoitem_idx is None:
+                self.sort_points()
+            else:
+                self.sort_points_ex(autoitem_idx)
+
+    @_batchable
+    @reapy.inside_reaper()
+    def _set_envelope_points(self, autoitem_idx, indices, times, values,
+                             shapes, tensions, selected, sort):
+        """
+        Set attributes of several points in one distant call.
+
+        Points of the underlying envelope are set if `autoitem_idx` is
+        None, and points of an automation item otherwise. Attributes
+        of None columns are read from the current points.
+        """
+        has_missing = None in (times, values, shapes, tensions, selected)
+        columns = _zip_point_columns(times, values, shapes, tensions, selected)
+        for ptidx, point in zip(indices, columns):
+            if has_missing:
+                current = self._get_point(ptidx, autoitem_idx)
+                point = [c if p is None else p for p, c in zip(point, current)]
+            if autoitem_idx is None:
+                RPR.SetEnvelopePoint(self.id, ptidx, *point, True)
+            else:
+                RPR.SetEnvelopePointEx(
+                    self.id, autoitem_idx, ptidx, *point, True
+                )
+        if sort and times is not None:
+            if autoitem_idx is None:
+                self.sort_points()
+            else:
+                self.sort_points_ex(autoitem_idx)
+
+    @reapy.inside_reaper()
+    def _set_point_value(self, ptidx, value):
+        """Set value of a point, keeping its other attributes."""
+        time, _, shape, tension, selected = self._get_point(ptidx)
+        RPR.SetEnvelopePoint(
+            self.id, ptidx, time, value, shape, tension, selected, True
+        )
+
+    @reapy.inside_reaper()
+    def _validate_id(self, project_id):
+        """
+        Return whether ID is valid, and ID of parent project.
+
+        Parent project is only looked up if `project_id` is None.
+        """
+        if project_id is None:
+            try:
+                project_id = self.parent.project.id
+            except (OSError, AttributeError):
+                return False, None
+        pointer, name = self._get_pointer_and_name()
+        return bool(RPR.ValidatePtr2(project_id, pointer, name)), project_id
+
     def add_item(self, position=0., length=1., pool=0):
         """
         Add automation item to envelope.
@@ -41,6 +210,30 @@ class Envelope(ReapyObject):
         item = reapy.AutomationItem(envelope=self, index=item_index)
         return item
 
+    def batch(self):
+        """
+        Return a context manager that groups envelope edits.
+
+        Calls to point insertion, edition, deletion and sorting methods
+        are queued inside the context, and all applied in a single
+        distant call when it exits. Queued calls are dropped if an
+        exception is raised inside the context.
+
+        Batches can be nested: calls queued in an inner batch are only
+        applied when the outermost batch exits.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> with envelope.batch():
+        ...     envelope.insert_envelope_point(1, 0.5)
+        ...     envelope.set_envelope_point(0, value=0.2)
+        ...     envelope.sort_points()
+        ...
+        """
+        return _EnvelopeBatch(self)
+
+    @_batchable
     def delete_points_in_range(self, start, end):
         """
         Delete envelope points between `start` and `end`.
@@ -82,11 +275,71 @@ class Envelope(ReapyObject):
         """
         d, d2, d3 = RPR.Envelope_Evaluate(self.id, time, 1, 1, 0, 0, 0, 0)[6:]
         if not raw:
-            d = RPR.Envelope_FormatValue(self.id, d, "", 2048)[2]
-            d2 = RPR.Envelope_FormatValue(self.id, d2, "", 2048)[2]
-            d3 = RPR.Envelope_FormatValue(self.id, d3, "", 2048)[2]
+            d = self._format_value(d)
+            d2 = self._format_value(d2)
+            d3 = self._format_value(d3)
         return d, d2, d3
 
+    def get_derivatives_batch(self, times, raw=False, as_array=False):
+        """
+        Return envelope derivatives of order 1, 2, 3 at several times.
+
+        All derivatives are computed in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        raw : bool, optional
+            Whether to return raw values or the human-readable version
+            which is printed in REAPER GUI (default=False).
+        as_array : bool, optional
+            Whether to return raw values as a ``numpy.ndarray`` of
+            shape ``(len(times), 3)`` and dtype ``float64`` instead of
+            a list (default=False). Requires ``numpy`` and `raw`.
+
+        Returns
+        -------
+        derivatives : list of (float, float, float) or numpy.ndarray
+            First, second and third order derivatives at each time.
+
+        Raises
+        ------
+        ValueError
+            If `as_array` is True but `raw` is False.
+
+        See also
+        --------
+        Envelope.get_derivatives
+        """
+        if as_array and not raw:
+            raise ValueError("Only raw values can be returned as an array.")
+        derivatives = self._get_derivatives_batch(list(map(float, times)), raw)
+        if as_array:
+            derivatives = _arrays.as_float_array(derivatives)
+        return derivatives
+
+    def get_point_index(self, time):
+        """
+        Return index of the point at or immediately before a given time.
+
+        Point times are retrieved in one distant call on first use and
+        then kept locally, so that subsequent lookups need no distant
+        call until points are edited with ``Envelope`` methods.
+
+        Parameters
+        ----------
+        time : float
+            Time in seconds.
+
+        Returns
+        -------
+        index : int
+            Point index, or -1 if there is no point at or before
+            `time`.
+        """
+        return bisect.bisect_right(self._get_point_times(), time) - 1
+
     @reapy.inside_reaper()
     def get_value(self, time, raw=False):
         """
@@ -116,27 +369,71 @@ class Envelope(ReapyObject):
         """
         value = RPR.Envelope_Evaluate(self.id, time, 0, 0, 0, 0, 0, 0)[5]
         if not raw:
-            value = RPR.Envelope_FormatValue(self.id, value, "", 2048)[2]
+            value = self._format_value(value)
         return value
 
-    @reapy.inside_reaper()
+    def get_values(self, times, raw=False, as_array=False):
+        """
+        Return envelope values at several times.
+
+        All values are computed in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        raw : bool, optional
+            Whether to return raw values or their human-readable
+            version, which is the one that is printed in REAPER GUI
+            (default=False).
+        as_array : bool, optional
+            Whether to return raw values as a ``numpy.ndarray`` of
+            dtype ``float64`` instead of a list (default=False).
+            Requires ``numpy`` and `raw`.
+
+        Returns
+        -------
+        values : list of float, list of str or numpy.ndarray
+            Envelope values.
+
+        Raises
+        ------
+        ValueError
+            If `as_array` is True but `raw` is False.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Pan"]
+        >>> envelope.get_values([0, 10], raw=True)
+        [0.0, -0.5145481809245827]
+        >>> envelope.get_values([0, 10])  # human-readable
+        ['center', '51%R']
+
+        See also
+        --------
+        Envelope.get_value
+        """
+        if as_array and not raw:
+            raise ValueError("Only raw values can be returned as an array.")
+        values = self._get_values(list(map(float, times)), raw)
+        if as_array:
+            values = _arrays.as_float_array(values)
+        return values
+
     @property
     def has_valid_id(self):
         """
         Whether ReaScript ID is still valid.
 
         For instance, if envelope has been deleted, ID will not be valid
-        anymore.
+        anymore. Parent project is only looked up on first access.
 
         :type: bool
         """
-        try:
-            project_id = self.parent.project.id
-        except (OSError, AttributeError):
-            return False
-        pointer, name = self._get_pointer_and_name()
-        return bool(RPR.ValidatePtr2(project_id, pointer, name))
+        is_valid, self._project_id = self._validate_id(self._project_id)
+        return is_valid
 
+    @_batchable
     def insert_envelope_point(self, time: float, value: float = 0.0, shape: int = 0, 
                               tension:float = 0.0, selected: bool = True, no_sort_in: bool = True):
         """
@@ -160,6 +457,7 @@ class Envelope(ReapyObject):
         """
         RPR.InsertEnvelopePoint(self.id, time, value, shape, tension, selected, no_sort_in)
 
+    @_batchable
     def insert_envelope_point_ex(self, autoitem_idx: int, time: float, value: float = 0.0, shape: int = 0, 
                               tension:float = 0.0, selected: bool = True, no_sort_in: bool = True):
         """
@@ -189,15 +487,85 @@ class Envelope(ReapyObject):
         # Todo check if 2nd arg should be self.items[autoitem_idx].id
         RPR.InsertEnvelopePointEx(self.id, autoitem_idx, time, value, shape, tension, selected, no_sort_in)    
 
+    def insert_envelope_points(self, points, sort: bool = True):
+        """
+        Insert several automation points in a single distant call.
+
+        Parameters
+        ----------
+        points : list of tuple
+            Points given as ``(time, value, shape, tension, selected)``
+            tuples. Trailing elements can be omitted, in which case the
+            defaults of ``Envelope.insert_envelope_point`` are used.
+            A sixth ``no_sort_in`` element is accepted and ignored,
+            since points are always inserted without sorting.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            inserted (default=True). Points are never sorted during
+            insertion.
+
+        Raises
+        ------
+        ValueError
+            If a point has no element or more than six.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> envelope.insert_envelope_points([(0, 0.5), (1, 1., 2)])
+        """
+        points = [_complete_point(point) for point in points]
+        self._insert_envelope_points(None, points, sort)
+
+    def insert_envelope_points_ex(self, autoitem_idx: int, points,
+                                  sort: bool = True):
+        """
+        Insert several automation points into an automation item in a
+        single distant call.
+
+        Parameters
+        ----------
+        autoitem_idx: int
+            Index of the envelope's automation item, if -1 then use the underlying item
+        points : list of tuple
+            Points given as ``(time, value, shape, tension, selected)``
+            tuples. Trailing elements can be omitted, in which case the
+            defaults of ``Envelope.insert_envelope_point_ex`` are used.
+            A sixth ``no_sort_in`` element is accepted and ignored,
+            since points are always inserted without sorting.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            inserted (default=True). Points are never sorted during
+            insertion.
+
+        Raises
+        ------
+        ValueError
+            If a point has no element or more than six.
+        """
+        points = [_complete_point(point) for point in points]
+        self._insert_envelope_points(autoitem_idx, points, sort)
+
+    def invalidate_cache(self):
+        """
+        Forget cached envelope name, parent project ID and point times.
+
+        They are retrieved again on next access. This is only needed
+        if the envelope has been renamed, moved to another project or
+        edited without ``Envelope`` methods (e.g. from REAPER GUI).
+        """
+        self._name = None
+        self._project_id = None
+        self._point_times = None
+
     @property
     def items(self):
         """
         List of automation items in envelope.
 
-        :type: list of reapy.AutomationItem
+        :type: reapy.AutomationItemList
         """
-        items = [reapy.AutomationItem(self, i) for i in range(self.n_items)]
-        return items
+        return reapy.AutomationItemList(self)
 
     @property
     def n_items(self):
@@ -206,8 +574,7 @@ class Envelope(ReapyObject):
 
         :type: int
         """
-        n_items = RPR.CountAutomationItems(self.id)
-        return n_items
+        return RPR.CountAutomationItems(self.id)
 
     @property
     def n_points(self):
@@ -216,18 +583,21 @@ class Envelope(ReapyObject):
 
         :type: int
         """
-        n_points = RPR.CountEnvelopePoints(self.id)
-        return n_points
+        return RPR.CountEnvelopePoints(self.id)
 
     @property
     def name(self):
         """
         Envelope name.
 
+        The name is retrieved on first access only, since it can not
+        change during the envelope lifetime.
+
         :type: str
         """
-        name = RPR.GetEnvelopeName(self.id, "", 2048)[2]
-        return name
+        if self._name is None:
+            self._name = RPR.GetEnvelopeName(self.id, "", 2048)[2]
+        return self._name
 
     @property
     def parent(self):
@@ -238,6 +608,34 @@ class Envelope(ReapyObject):
         """
         return self._parent
 
+    def resample(self, times):
+        """
+        Return envelope values linearly interpolated at several times.
+
+        Envelope points are retrieved in one distant call and
+        interpolation is then performed locally (JIT-compiled with
+        ``numba`` if it is installed). Contrary to
+        ``Envelope.get_values``, point shapes are not taken into
+        account.
+
+        Parameters
+        ----------
+        times : list of float
+            Times in seconds.
+
+        Returns
+        -------
+        values : list of float
+            Raw envelope values.
+
+        Raises
+        ------
+        ValueError
+            If envelope has no points.
+        """
+        return _resample.resample_linear(*self._get_points(), times)
+
+    @_batchable
     def set_envelope_point(self, ptidx: int, time: Optional[float] = None, value: Optional[float] = None, shape: Optional[int] = None, 
                            tension: Optional[float] = None, selected: Optional[bool] = None, no_sort_in: Optional[bool] = None):
         """
@@ -264,6 +662,7 @@ class Envelope(ReapyObject):
         # TODO check whether None is ok as value
         RPR.SetEnvelopePoint(self.id, ptidx, time, value, shape, tension, selected, no_sort_in)
 
+    @_batchable
     def set_envelope_point_ex(self, autoitem_idx: int, ptidx: int, time: Optional[float] = None, 
                               value: Optional[float] = None, shape: Optional[int] = None, 
                               tension: Optional[float] = None, selected: Optional[bool] = None, 
@@ -293,14 +692,178 @@ class Envelope(ReapyObject):
         """
         RPR.SetEnvelopePointEx(self.id, autoitem_idx, ptidx, time, value, shape, tension, selected, no_sort_in)
 
+    def set_envelope_points(self, indices, times=None, values=None,
+                            shapes=None, tensions=None, selected=None,
+                            sort=True):
+        """
+        Set attributes of several envelope points in a single distant
+        call.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Indices of the points to be set. All point attributes may
+            be given as any iterable, e.g. ``numpy.ndarray``.
+        times : list of float, optional
+            New point times in seconds. If None (default), times are
+            left unchanged. The same goes for the other attributes.
+        values : list of float, optional
+            New point values.
+        shapes : list of int, optional
+            New point shapes (see ``Envelope.set_envelope_point``).
+        tensions : list of float, optional
+            New point tensions.
+        selected : list of bool, optional
+            New point selection states.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            set (default=True). Only applies when `times` is given.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> envelope.set_envelope_points([0, 1], values=[0.2, 0.8])
+        """
+        self._set_envelope_points(None, *_as_point_columns(
+            indices, times, values, shapes, tensions, selected
+        ), sort=sort)
+
+    def set_envelope_points_ex(self, autoitem_idx, indices, times=None,
+                               values=None, shapes=None, tensions=None,
+                               selected=None, sort=True):
+        """
+        Set attributes of several envelope points of an AutomationItem
+        in a single distant call.
+
+        Parameters
+        ----------
+        autoitem_idx: int
+            Index of the automation item, if == -1, then the target is the underlying envelope
+        indices : iterable of int
+            Indices of the points to be set. All point attributes may
+            be given as any iterable, e.g. ``numpy.ndarray``.
+        times : list of float, optional
+            New point times in seconds. If None (default), times are
+            left unchanged. The same goes for the other attributes.
+        values : list of float, optional
+            New point values.
+        shapes : list of int, optional
+            New point shapes (see ``Envelope.set_envelope_point``).
+        tensions : list of float, optional
+            New point tensions.
+        selected : list of bool, optional
+            New point selection states.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            set (default=True). Only applies when `times` is given.
+        """
+        self._set_envelope_points(autoitem_idx, *_as_point_columns(
+            indices, times, values, shapes, tensions, selected
+        ), sort=sort)
+
+    @_batchable
+    def set_point_at_time(self, time, value):
+        """
+        Set value of the point at or immediately before a given time.
+
+        The point is looked up with ``Envelope.get_point_index``, and
+        its time, shape, tension and selection state are kept.
+
+        Parameters
+        ----------
+        time : float
+            Time in seconds.
+        value : float
+            New point value.
+
+        Raises
+        ------
+        ValueError
+            If there is no point at or before `time`.
+        """
+        index = self.get_point_index(time)
+        if index == -1:
+            raise ValueError("No point at or before {}s.".format(time))
+        self._set_point_value(index, value)
+
+    @_batchable
     def sort_points(self):
         """Sort all points along the time scale"""
         RPR.Envelope_SortPoints(self.id)
 
+    @_batchable
     def sort_points_ex(self, autoitemidx: int):
         RPR.Envelope_SortPointsEx(self.id, autoitemidx)
 
 
+def _as_point_columns(indices, times, values, shapes, tensions, selected):
+    """
+    Return point attribute columns as lists of built-in types.
+
+    Columns can thus be any iterable (e.g. ``numpy.ndarray``) and still
+    be sent in a distant call. None columns are left as is.
+    """
+    columns = indices, times, values, shapes, tensions, selected
+    types = int, float, float, int, float, bool
+    return [
+        None if column is None else list(map(type_, column))
+        for column, type_ in zip(columns, types)
+    ]
+
+
+def _complete_point(point):
+    """
+    Complete a partial (time, value, shape, tension, selected) tuple.
+
+    A trailing ``no_sort_in`` element is dropped, since points are
+    always inserted without sorting.
+    """
+    point = tuple(point)
+    if not 1 <= len(point) <= 6:
+        raise ValueError(
+            "Points must have 1 to 6 elements, got {}.".format(len(point))
+        )
+    return point[:5] + _POINT_DEFAULTS[len(point) - 1:]
+
+
+def _zip_point_columns(*columns):
+    """Zip point attribute columns, replacing None columns by Nones."""
+    return zip(*(
+        itertools.repeat(None) if column is None else column
+        for column in columns
+    ))
+
+
+class _EnvelopeBatch:
+
+    """Context manager used by Envelope.batch."""
+
+    def __init__(self, envelope):
+        self.envelope = envelope
+        self._is_outermost = None
+        self._start = None
+
+    def __enter__(self):
+        self._is_outermost = self.envelope._pending is None
+        if self._is_outermost:
+            self.envelope._pending = []
+        # Calls queued before a nested batch belong to outer batches.
+        self._start = len(self.envelope._pending)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        operations = self.envelope._pending
+        if exc_type is not None:
+            del operations[self._start:]
+        if not self._is_outermost:
+            return False
+        self.envelope._pending = None
+        if operations:
+            self.envelope._apply_operations(operations)
+            # Point times may have been read while edits were queued.
+            self.envelope._point_times = None
+        return False
+
+
 class EnvelopeList(ReapyObject):
 
     """
@@ -324,22 +887,37 @@ class EnvelopeList(ReapyObject):
     ['Volume', 'Pan']
     """
 
+    # Names rather than functions are stored since functions of
+    # reascript_api are redefined when reapy reconnects.
+    _getters = {
+        "Take": {
+            "index": "GetTakeEnvelope",
+            "name": "GetTakeEnvelopeByName",
+        },
+        "Track": {
+            "chunk_name": "GetTrackEnvelopeByChunkName",
+            "index": "GetTrackEnvelope",
+            "name": "GetTrackEnvelopeByName",
+        },
+    }
+
     def __init__(self, parent):
         self.parent = parent
+        parent_type = parent.__class__._reapy_parent.__name__
+        self._getter_names = self._getters[parent_type]
 
     @property
     def _args(self):
         return (self.parent,)
 
     def __getitem__(self, key):
-        parent_type = self.parent.__class__._reapy_parent.__name__
-        attr = "Get{}Envelope".format(parent_type)
-        if isinstance(key, str):
-            if key.startswith("<") and parent_type == 'Track':
-                attr += "ByChunkName"
-            else:
-                attr += "ByName"
-        callback = getattr(RPR, attr)
+        if not isinstance(key, str):
+            key_type = "index"
+        elif key.startswith("<") and "chunk_name" in self._getter_names:
+            key_type = "chunk_name"
+        else:
+            key_type = "name"
+        callback = getattr(RPR, self._getter_names[key_type])
         envelope = Envelope(self.parent, callback(self.parent.id, key))
         if not envelope._is_defined:
             raise KeyError("No envelope for key {}".format(repr(key)))
@@ -2,11 +2,36 @@ import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
 import typing as ty
+from typing import Optional
+
+
+_FORMAT_BUFFER_SIZE: int
+_POINT_DEFAULTS: ty.Tuple[float, int, float, bool]
+
+_KEEP_POINT_TIMES: ty.FrozenSet[str]
+
+_Method = ty.TypeVar("_Method", bound=ty.Callable[..., ty.Any])
+
+
+def _batchable(method: _Method) -> _Method:
+    """
+    Make an Envelope method queue its calls during Envelope.batch.
+
+    Unless the method is in ``_KEEP_POINT_TIMES``, calling it also
+    invalidates the local index of point times.
+    """
+    ...
 
 
 class Envelope(ReapyObject):
     id: int
     _parent: ty.Union[ty.Type[reapy.Take], ty.Type[reapy.Track]]
+    _name: ty.Optional[str]
+    _project_id: ty.Optional[str]
+    _pending: ty.Optional[
+        ty.List[ty.Tuple[str, ty.Tuple[ty.Any, ...], ty.Dict[str, ty.Any]]]
+    ]
+    _point_times: ty.Optional[ty.List[float]]
 
     def __init__(self, parent: ReapyObject, id: int) -> None:
         ...
@@ -15,6 +40,111 @@ class Envelope(ReapyObject):
     def _args(self) -> ty.Tuple[ReapyObject, int]:
         ...
 
+    @reapy.inside_reaper()
+    def _apply_operations(
+        self,
+        operations: ty.List[
+            ty.Tuple[str, ty.Tuple[ty.Any, ...], ty.Dict[str, ty.Any]]
+        ]
+    ) -> None:
+        """Apply operations queued during Envelope.batch."""
+        ...
+
+    def _format_value(self, value: float) -> str:
+        """Return human-readable version of a raw envelope value."""
+        ...
+
+    @reapy.inside_reaper()
+    def _get_derivatives_batch(
+        self, times: ty.Sequence[float], raw: bool
+    ) -> ty.List[ty.Tuple[float, float, float]]:
+        """Return derivatives at several times in one distant call."""
+        ...
+
+    def _get_point(
+        self, ptidx: int, autoitem_idx: ty.Optional[int] = None
+    ) -> ty.Tuple[float, float, int, float, bool]:
+        """
+        Return (time, value, shape, tension, selected) of a point.
+
+        The point is read from the underlying envelope if
+        `autoitem_idx` is None, and from an automation item otherwise.
+        """
+        ...
+
+    def _get_point_times(self) -> ty.List[float]:
+        """
+        Return point times, from the local index if it is valid.
+
+        During Envelope.batch, times are not stored in the local index
+        since queued edits are not applied yet.
+        """
+        ...
+
+    @reapy.inside_reaper()
+    def _get_points(self) -> ty.Tuple[ty.List[float], ty.List[float]]:
+        """Return times and values of all envelope points."""
+        ...
+
+    @reapy.inside_reaper()
+    def _get_values(
+        self, times: ty.Sequence[float], raw: bool
+    ) -> ty.Union[ty.List[float], ty.List[str]]:
+        """Return values at several times in one distant call."""
+        ...
+
+    @reapy.inside_reaper()
+    def _insert_envelope_points(
+        self,
+        autoitem_idx: ty.Optional[int],
+        points: ty.List[ty.Tuple[float, float, int, float, bool]],
+        sort: bool
+    ) -> None:
+        """
+        Insert several complete points in one distant call.
+
+        Points are inserted in the underlying envelope if
+        `autoitem_idx` is None, and in an automation item otherwise.
+        """
+        ...
+
+    @reapy.inside_reaper()
+    def _set_envelope_points(
+        self,
+        autoitem_idx: ty.Optional[int],
+        indices: ty.List[int],
+        times: ty.Optional[ty.List[float]],
+        values: ty.Optional[ty.List[float]],
+        shapes: ty.Optional[ty.List[int]],
+        tensions: ty.Optional[ty.List[float]],
+        selected: ty.Optional[ty.List[bool]],
+        sort: bool
+    ) -> None:
+        """
+        Set attributes of several points in one distant call.
+
+        Points of the underlying envelope are set if `autoitem_idx` is
+        None, and points of an automation item otherwise. Attributes
+        of None columns are read from the current points.
+        """
+        ...
+
+    @reapy.inside_reaper()
+    def _set_point_value(self, ptidx: int, value: float) -> None:
+        """Set value of a point, keeping its other attributes."""
+        ...
+
+    @reapy.inside_reaper()
+    def _validate_id(
+        self, project_id: ty.Optional[str]
+    ) -> ty.Tuple[bool, ty.Optional[str]]:
+        """
+        Return whether ID is valid, and ID of parent project.
+
+        Parent project is only looked up if `project_id` is None.
+        """
+        ...
+
     def add_item(self, position: float = 0., length: float = 1.,
                  pool: int = 0) -> reapy.AutomationItem:
         """
@@ -38,6 +168,29 @@ class Envelope(ReapyObject):
         """
         ...
 
+    def batch(self) -> "_EnvelopeBatch":
+        """
+        Return a context manager that groups envelope edits.
+
+        Calls to point insertion, edition, deletion and sorting methods
+        are queued inside the context, and all applied in a single
+        distant call when it exits. Queued calls are dropped if an
+        exception is raised inside the context.
+
+        Batches can be nested: calls queued in an inner batch are only
+        applied when the outermost batch exits.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> with envelope.batch():
+        ...     envelope.insert_envelope_point(1, 0.5)
+        ...     envelope.set_envelope_point(0, value=0.2)
+        ...     envelope.sort_points()
+        ...
+        """
+        ...
+
     def delete_points_in_range(self, start: float, end: float) -> None:
         """
         Delete envelope points between `start` and `end`.
@@ -80,6 +233,66 @@ class Envelope(ReapyObject):
         """
         ...
 
+    def get_derivatives_batch(
+        self,
+        times: ty.Iterable[float],
+        raw: bool = False,
+        as_array: bool = False
+    ) -> ty.Union[ty.List[ty.Tuple[float, float, float]], ty.Any]:
+        """
+        Return envelope derivatives of order 1, 2, 3 at several times.
+
+        All derivatives are computed in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        raw : bool, optional
+            Whether to return raw values or the human-readable version
+            which is printed in REAPER GUI (default=False).
+        as_array : bool, optional
+            Whether to return raw values as a ``numpy.ndarray`` of
+            shape ``(len(times), 3)`` and dtype ``float64`` instead of
+            a list (default=False). Requires ``numpy`` and `raw`.
+
+        Returns
+        -------
+        derivatives : list of (float, float, float) or numpy.ndarray
+            First, second and third order derivatives at each time.
+
+        Raises
+        ------
+        ValueError
+            If `as_array` is True but `raw` is False.
+
+        See also
+        --------
+        Envelope.get_derivatives
+        """
+        ...
+
+    def get_point_index(self, time: float) -> int:
+        """
+        Return index of the point at or immediately before a given time.
+
+        Point times are retrieved in one distant call on first use and
+        then kept locally, so that subsequent lookups need no distant
+        call until points are edited with ``Envelope`` methods.
+
+        Parameters
+        ----------
+        time : float
+            Time in seconds.
+
+        Returns
+        -------
+        index : int
+            Point index, or -1 if there is no point at or before
+            `time`.
+        """
+        ...
+
     @reapy.inside_reaper()
     def get_value(self, time: float,
                   raw: bool = False) -> ty.Union[float, str]:
@@ -110,14 +323,61 @@ class Envelope(ReapyObject):
         """
         ...
 
-    @reapy.inside_reaper()
+    def get_values(
+        self,
+        times: ty.Iterable[float],
+        raw: bool = False,
+        as_array: bool = False
+    ) -> ty.Union[ty.List[float], ty.List[str], ty.Any]:
+        """
+        Return envelope values at several times.
+
+        All values are computed in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        raw : bool, optional
+            Whether to return raw values or their human-readable
+            version, which is the one that is printed in REAPER GUI
+            (default=False).
+        as_array : bool, optional
+            Whether to return raw values as a ``numpy.ndarray`` of
+            dtype ``float64`` instead of a list (default=False).
+            Requires ``numpy`` and `raw`.
+
+        Returns
+        -------
+        values : list of float, list of str or numpy.ndarray
+            Envelope values.
+
+        Raises
+        ------
+        ValueError
+            If `as_array` is True but `raw` is False.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Pan"]
+        >>> envelope.get_values([0, 10], raw=True)
+        [0.0, -0.5145481809245827]
+        >>> envelope.get_values([0, 10])  # human-readable
+        ['center', '51%R']
+
+        See also
+        --------
+        Envelope.get_value
+        """
+        ...
+
     @property
     def has_valid_id(self) -> bool:
         """
         Whether ReaScript ID is still valid.
 
         For instance, if envelope has been deleted, ID will not be valid
-        anymore.
+        anymore. Parent project is only looked up on first access.
 
         :type: bool
         """
@@ -174,12 +434,87 @@ class Envelope(ReapyObject):
         """
         ...
 
+    def insert_envelope_points(
+        self,
+        points: ty.Sequence[ty.Sequence[float]],
+        sort: bool = True
+    ) -> None:
+        """
+        Insert several automation points in a single distant call.
+
+        Parameters
+        ----------
+        points : list of tuple
+            Points given as ``(time, value, shape, tension, selected)``
+            tuples. Trailing elements can be omitted, in which case the
+            defaults of ``Envelope.insert_envelope_point`` are used.
+            A sixth ``no_sort_in`` element is accepted and ignored,
+            since points are always inserted without sorting.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            inserted (default=True). Points are never sorted during
+            insertion.
+
+        Raises
+        ------
+        ValueError
+            If a point has no element or more than six.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> envelope.insert_envelope_points([(0, 0.5), (1, 1., 2)])
+        """
+        ...
+
+    def insert_envelope_points_ex(
+        self,
+        autoitem_idx: int,
+        points: ty.Sequence[ty.Sequence[float]],
+        sort: bool = True
+    ) -> None:
+        """
+        Insert several automation points into an automation item in a
+        single distant call.
+
+        Parameters
+        ----------
+        autoitem_idx: int
+            Index of the envelope's automation item, if -1 then use the underlying item
+        points : list of tuple
+            Points given as ``(time, value, shape, tension, selected)``
+            tuples. Trailing elements can be omitted, in which case the
+            defaults of ``Envelope.insert_envelope_point_ex`` are used.
+            A sixth ``no_sort_in`` element is accepted and ignored,
+            since points are always inserted without sorting.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            inserted (default=True). Points are never sorted during
+            insertion.
+
+        Raises
+        ------
+        ValueError
+            If a point has no element or more than six.
+        """
+        ...
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget cached envelope name, parent project ID and point times.
+
+        They are retrieved again on next access. This is only needed
+        if the envelope has been renamed, moved to another project or
+        edited without ``Envelope`` methods (e.g. from REAPER GUI).
+        """
+        ...
+
     @property
-    def items(self) -> ty.List[reapy.AutomationItem]:
+    def items(self) -> reapy.AutomationItemList:
         """
         List of automation items in envelope.
 
-        :type: list of reapy.AutomationItem
+        :type: reapy.AutomationItemList
         """
         ...
 
@@ -206,6 +541,9 @@ class Envelope(ReapyObject):
         """
         Envelope name.
 
+        The name is retrieved on first access only, since it can not
+        change during the envelope lifetime.
+
         :type: str
         """
         ...
@@ -219,6 +557,33 @@ class Envelope(ReapyObject):
         """
         ...
 
+    def resample(self, times: ty.Sequence[float]) -> ty.List[float]:
+        """
+        Return envelope values linearly interpolated at several times.
+
+        Envelope points are retrieved in one distant call and
+        interpolation is then performed locally (JIT-compiled with
+        ``numba`` if it is installed). Contrary to
+        ``Envelope.get_values``, point shapes are not taken into
+        account.
+
+        Parameters
+        ----------
+        times : list of float
+            Times in seconds.
+
+        Returns
+        -------
+        values : list of float
+            Raw envelope values.
+
+        Raises
+        ------
+        ValueError
+            If envelope has no points.
+        """
+        ...
+
     def set_envelope_point(self, ptidx: int, time: Optional[float] = None, value: Optional[float] = None, shape: Optional[int] = None, 
                            tension: Optional[float] = None, selected: Optional[bool] = None, no_sort_in: Optional[bool] = None) -> None:
         """
@@ -273,6 +638,107 @@ class Envelope(ReapyObject):
         """
         ...
 
+    def set_envelope_points(
+        self,
+        indices: ty.Iterable[int],
+        times: ty.Optional[ty.Iterable[float]] = None,
+        values: ty.Optional[ty.Iterable[float]] = None,
+        shapes: ty.Optional[ty.Iterable[int]] = None,
+        tensions: ty.Optional[ty.Iterable[float]] = None,
+        selected: ty.Optional[ty.Iterable[bool]] = None,
+        sort: bool = True
+    ) -> None:
+        """
+        Set attributes of several envelope points in a single distant
+        call.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Indices of the points to be set. All point attributes may
+            be given as any iterable, e.g. ``numpy.ndarray``.
+        times : list of float, optional
+            New point times in seconds. If None (default), times are
+            left unchanged. The same goes for the other attributes.
+        values : list of float, optional
+            New point values.
+        shapes : list of int, optional
+            New point shapes (see ``Envelope.set_envelope_point``).
+        tensions : list of float, optional
+            New point tensions.
+        selected : list of bool, optional
+            New point selection states.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            set (default=True). Only applies when `times` is given.
+
+        Examples
+        --------
+        >>> envelope = track.envelopes["Volume"]
+        >>> envelope.set_envelope_points([0, 1], values=[0.2, 0.8])
+        """
+        ...
+
+    def set_envelope_points_ex(
+        self,
+        autoitem_idx: int,
+        indices: ty.Iterable[int],
+        times: ty.Optional[ty.Iterable[float]] = None,
+        values: ty.Optional[ty.Iterable[float]] = None,
+        shapes: ty.Optional[ty.Iterable[int]] = None,
+        tensions: ty.Optional[ty.Iterable[float]] = None,
+        selected: ty.Optional[ty.Iterable[bool]] = None,
+        sort: bool = True
+    ) -> None:
+        """
+        Set attributes of several envelope points of an AutomationItem
+        in a single distant call.
+
+        Parameters
+        ----------
+        autoitem_idx: int
+            Index of the automation item, if == -1, then the target is the underlying envelope
+        indices : iterable of int
+            Indices of the points to be set. All point attributes may
+            be given as any iterable, e.g. ``numpy.ndarray``.
+        times : list of float, optional
+            New point times in seconds. If None (default), times are
+            left unchanged. The same goes for the other attributes.
+        values : list of float, optional
+            New point values.
+        shapes : list of int, optional
+            New point shapes (see ``Envelope.set_envelope_point``).
+        tensions : list of float, optional
+            New point tensions.
+        selected : list of bool, optional
+            New point selection states.
+        sort : bool, optional
+            Whether to sort envelope points once all points have been
+            set (default=True). Only applies when `times` is given.
+        """
+        ...
+
+    def set_point_at_time(self, time: float, value: float) -> None:
+        """
+        Set value of the point at or immediately before a given time.
+
+        The point is looked up with ``Envelope.get_point_index``, and
+        its time, shape, tension and selection state are kept.
+
+        Parameters
+        ----------
+        time : float
+            Time in seconds.
+        value : float
+            New point value.
+
+        Raises
+        ------
+        ValueError
+            If there is no point at or before `time`.
+        """
+        ...
+
     def sort_points(self) -> None:
         """Sort all points along the time scale"""
         ...
@@ -280,6 +746,60 @@ class Envelope(ReapyObject):
     def sort_points_ex(self, autoitemidx: int) -> None:
         ...
 
+
+def _as_point_columns(
+    indices: ty.Iterable[int],
+    times: ty.Optional[ty.Iterable[float]],
+    values: ty.Optional[ty.Iterable[float]],
+    shapes: ty.Optional[ty.Iterable[int]],
+    tensions: ty.Optional[ty.Iterable[float]],
+    selected: ty.Optional[ty.Iterable[bool]]
+) -> ty.List[ty.Optional[ty.List[ty.Any]]]:
+    """
+    Return point attribute columns as lists of built-in types.
+
+    Columns can thus be any iterable (e.g. ``numpy.ndarray``) and still
+    be sent in a distant call. None columns are left as is.
+    """
+    ...
+
+
+def _complete_point(
+    point: ty.Sequence[float]
+) -> ty.Tuple[float, float, int, float, bool]:
+    """
+    Complete a partial (time, value, shape, tension, selected) tuple.
+
+    A trailing ``no_sort_in`` element is dropped, since points are
+    always inserted without sorting.
+    """
+    ...
+
+
+def _zip_point_columns(
+    *columns: ty.Optional[ty.Sequence[ty.Any]]
+) -> ty.Iterator[ty.Tuple[ty.Any, ...]]:
+    """Zip point attribute columns, replacing None columns by Nones."""
+    ...
+
+
+class _EnvelopeBatch:
+    """Context manager used by Envelope.batch."""
+    envelope: Envelope
+    _is_outermost: ty.Optional[bool]
+    _start: ty.Optional[int]
+
+    def __init__(self, envelope: Envelope) -> None:
+        ...
+
+    def __enter__(self) -> None:
+        ...
+
+    def __exit__(self, exc_type: ty.Any, exc_val: ty.Any,
+                 exc_tb: ty.Any) -> bool:
+        ...
+
+
 class EnvelopeList(ReapyObject):
     """
     Container class for the list of envelopes on a Take or Track.
@@ -302,6 +822,8 @@ class EnvelopeList(ReapyObject):
     ['Volume', 'Pan']
     """
     parent: ty.Union[ty.Type[reapy.Take], ty.Type[reapy.Track]]
+    _getters: ty.Dict[str, ty.Dict[str, str]]
+    _getter_names: ty.Dict[str, str]
 
     def __init__(self,
                  parent: ty.Union[ty.Type[reapy.Take], ty.Type[reapy.Track]]
@@ -1,12 +1,13 @@
 """Defines class Project."""
 
 import pickle
-import codecs
+import base64
+import io
 import os
 
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, _arrays
 from reapy.errors import RedoError, UndoError
 
 
@@ -14,6 +15,8 @@ class Project(ReapyObject):
 
     """REAPER project."""
 
+    __slots__ = ("id", "_filename", "_is_closed", "_master_track")
+
     def __init__(self, id=None, index=-1):
         """
         Build project either by ID or index.
@@ -36,20 +39,69 @@ class Project(ReapyObject):
             id, index = None, id
         if id is None:
             id = RPR.EnumProjects(index, None, 0)[0]
-        if not id.startswith('(ReaProject*)0x'):
+        elif not id.startswith('(ReaProject*)0x'):
             id = Project._from_name(id).id
         self.id = id
         self._filename = None
+        self._is_closed = False
+        self._master_track = None
 
     def __eq__(self, other):
-        if hasattr(other, 'id'):
-            return self.id == other.id
-        return False
+        return isinstance(other, Project) and self.id == other.id
 
     @property
     def _args(self):
         return self.id,
 
+    @reapy.inside_reaper()
+    def _add_markers_regions(self, specs):
+        """Add markers or regions from normalized specs, return indices."""
+        ids = []
+        for is_region, start, end, name, color in specs:
+            if isinstance(color, (tuple, list)):
+                color = reapy.rgb_to_native(color) | 0x1000000
+            ids.append(RPR.AddProjectMarker2(
+                self.id, is_region, start, end, name, -1, color
+            ))
+        return ids
+
+    @reapy.inside_reaper()
+    def _beats_to_times(self, beats):
+        """Convert list of times in beats to seconds."""
+        return [RPR.TimeMap2_QNToTime(self.id, b) for b in beats]
+
+    @reapy.inside_reaper()
+    def _close(self):
+        """
+        Close project and return its file path and whether it closed.
+
+        Closing a dirty project prompts for saving, and the user can
+        cancel it, in which case the project stays open.
+        """
+        filename = os.path.join(self.path, self.name)
+        with self.make_current_project():
+            reapy.perform_action(40860)
+        is_closed = not RPR.ValidatePtr(*self._get_pointer_and_name())
+        return filename, is_closed
+
+    @reapy.inside_reaper()
+    def _enumerate_markers_regions(self):
+        """
+        Return marker and region IDs with a single enumeration.
+
+        Returns
+        -------
+        marker_ids, region_ids : list of int, list of int
+        """
+        marker_ids, region_ids = [], []
+        for i in range(sum(self._marker_region_counts())):
+            res = RPR.EnumProjectMarkers2(self.id, i, 0, 0, 0, 0, 0)
+            if res[3]:
+                region_ids.append(res[0])
+            else:
+                marker_ids.append(res[0])
+        return marker_ids, region_ids
+
     @staticmethod
     def _from_name(name):
         """Return project with corresponding name.
@@ -71,20 +123,75 @@ class Project(ReapyObject):
         """
         if not name.lower().endswith('.rpp'):
             name += '.rpp'
-        with reapy.inside_reaper():
-            for project in reapy.get_projects():
-                project_name = project.name[:-4] + '.rpp'
-                if project_name == name:
-                    return project
-        raise NameError('"{}" is not currently open.'.format(name))
+        id = Project._get_project_id_by_name(name)
+        if id is None:
+            raise NameError('"{}" is not currently open.'.format(name))
+        return Project(id)
 
     @reapy.inside_reaper()
-    def _get_track_by_name(self, name):
-        """Return first track with matching name."""
-        for track in self.tracks:
-            if track.name == name:
-                return track
-        raise KeyError(name)
+    def _get_ext_states(self, keys):
+        """Return raw ext state values for ``(section, key)`` pairs."""
+        return [
+            RPR.GetProjExtState(self.id, section, key, "", 2**31 - 1)[4]
+            for section, key in keys
+        ]
+
+    @reapy.inside_reaper()
+    def _get_item_ids(self):
+        """Return ReaScript IDs of all items in project."""
+        n_items = RPR.CountMediaItems(self.id)
+        return [RPR.GetMediaItem(self.id, i) for i in range(n_items)]
+
+    @staticmethod
+    @reapy.inside_reaper()
+    def _get_project_id_by_name(name):
+        """Return ID of first project named `name`, or None."""
+        i = 0
+        id = RPR.EnumProjects(i, None, 0)[0]
+        while not id.endswith("0x0000000000000000"):
+            _, project_name, _ = RPR.GetProjectName(id, "", 2048)
+            if project_name[:-4] + '.rpp' == name:
+                return id
+            i += 1
+            id = RPR.EnumProjects(i, None, 0)[0]
+        return None
+
+    @reapy.inside_reaper()
+    def _get_selected_item_ids(self):
+        """Return ReaScript IDs of selected items in project."""
+        n_items = RPR.CountSelectedMediaItems(self.id)
+        return [RPR.GetSelectedMediaItem(self.id, i) for i in range(n_items)]
+
+    @reapy.inside_reaper()
+    def _get_track_id_by_name(self, name):
+        """Return ID of first track named `name`, or None."""
+        for i in range(RPR.CountTracks(self.id)):
+            id = RPR.GetTrack(self.id, i)
+            if RPR.GetTrackName(id, "", 2048)[2] == name:
+                return id
+        return None
+
+    def _get_track_id_by_number(self, number):
+        """Return ID of track `number` as numbered in GUI (0 is master)."""
+        if number == 0:
+            return RPR.GetMasterTrack(self.id)
+        return RPR.GetTrack(self.id, number - 1)
+
+    def _marker_region_counts(self):
+        """Return numbers of markers and regions in project."""
+        _, _, n_markers, n_regions = RPR.CountProjectMarkers(self.id, 0, 0)
+        return n_markers, n_regions
+
+    @reapy.inside_reaper()
+    def _set_ext_states(self, states):
+        """Set raw ext state values from ``(section, key, value)``."""
+        for section, key, value in states:
+            RPR.SetProjExtState(self.id, section, key, value)
+
+    @reapy.inside_reaper()
+    def _times_to_beats(self, times):
+        """Convert list of times in seconds to beats."""
+        return [RPR.TimeMap2_timeToQN(self.id, t) for t in times]
 
     def add_marker(self, position, name="", color=0):
         """
@@ -111,14 +218,38 @@ class Project(ReapyObject):
         new marker will be created, and the existing marker index will
         be returned.
         """
-        if isinstance(color, tuple):
-            color = reapy.rgb_to_native(color) | 0x1000000
-        marker_id = RPR.AddProjectMarker2(
-            self.id, False, position, 0, name, -1, color
+        marker_id, = self._add_markers_regions(
+            [(False, position, 0, name, color)]
         )
         marker = reapy.Marker(self, marker_id)
         return marker
 
+    def add_markers(self, markers):
+        """
+        Create several markers in a single distant call.
+
+        Parameters
+        ----------
+        markers : iterable of tuple
+            Each tuple is ``(position[, name[, color]])``, with the
+            same meaning and defaults as in Project.add_marker.
+
+        Returns
+        -------
+        markers : list of reapy.Marker
+            New markers.
+
+        See also
+        --------
+        Project.add_marker
+        """
+        specs = []
+        for marker in markers:
+            position, name, color = _with_name_and_color(marker, 1)
+            specs.append((False, position, 0, name, color))
+        ids = self._add_markers_regions(specs)
+        return [reapy.Marker(self, i) for i in ids]
+
     def add_region(self, start, end, name="", color=0):
         """
         Create new region and return its index.
@@ -140,16 +271,40 @@ class Project(ReapyObject):
         region : reapy.Region
             New region.
         """
-        if isinstance(color, tuple):
-            color = reapy.rgb_to_native(color) | 0x1000000
-        region_id = RPR.AddProjectMarker2(
-            self.id, True, start, end, name, -1, color
+        region_id, = self._add_markers_regions(
+            [(True, start, end, name, color)]
         )
         region = reapy.Region(self, region_id)
         return region
 
+    def add_regions(self, regions):
+        """
+        Create several regions in a single distant call.
+
+        Parameters
+        ----------
+        regions : iterable of tuple
+            Each tuple is ``(start, end[, name[, color]])``, with the
+            same meaning and defaults as in Project.add_region.
+
+        Returns
+        -------
+        regions : list of reapy.Region
+            New regions.
+
+        See also
+        --------
+        Project.add_region
+        """
+        specs = []
+        for region in regions:
+            start, end, name, color = _with_name_and_color(region, 2)
+            specs.append((True, start, end, name, color))
+        ids = self._add_markers_regions(specs)
+        return [reapy.Region(self, i) for i in ids]
+
     @reapy.inside_reaper()
-    def add_track(self, index=0, name=""):
+    def add_track(self, index=0, name="", rec_arm=False, rec_input=None):
         """
         Add track at a specified index.
 
@@ -159,20 +314,31 @@ class Project(ReapyObject):
             Index at which to insert track.
         name : str, optional
             Name of created track.
+        rec_arm : bool, optional
+            Whether to arm created track for recording (default=False).
+        rec_input : int or None, optional
+            Record input of created track (see ``I_RECINPUT`` in
+            ``Track.set_info_value``). If None (default), REAPER
+            default input is kept.
 
         Returns
         -------
         track : Track
             New track.
         """
-        n_tracks = self.n_tracks
+        n_tracks = RPR.CountTracks(self.id)
         index = max(-n_tracks, min(index, n_tracks))
         if index < 0:
             index = index % n_tracks
         with self.make_current_project():
             RPR.InsertTrackAtIndex(index, True)
-        track = self.tracks[index]
-        track.name = name
+        track = reapy.Track(RPR.GetTrack(self.id, index))
+        if name:
+            track.name = name
+        if rec_input is not None:
+            track.set_info_value("I_RECINPUT", rec_input)
+        if rec_arm:
+            track.recarm_change(1)
         return track
 
     @property
@@ -209,6 +375,35 @@ class Project(ReapyObject):
         time = RPR.TimeMap2_QNToTime(self.id, beats)
         return time
 
+    def beats_to_time_batch(self, beats, as_array=False):
+        """
+        Convert several times in beats to seconds.
+
+        All times are converted in a single distant call.
+
+        Parameters
+        ----------
+        beats : iterable of float
+            Times in beats. A ``numpy.ndarray`` is accepted.
+        as_array : bool, optional
+            Whether to return a ``numpy.ndarray`` of dtype ``float64``
+            instead of a list (default=False). Requires ``numpy``.
+
+        Returns
+        -------
+        times : list of float or numpy.ndarray
+            Converted times in seconds.
+
+        See also
+        --------
+        Project.beats_to_time
+        Project.time_to_beats_batch
+        """
+        times = self._beats_to_times(list(map(float, beats)))
+        if as_array:
+            times = _arrays.as_float_array(times)
+        return times
+
     def begin_undo_block(self):
         """
         Start a new undo block.
@@ -224,6 +419,11 @@ class Project(ReapyObject):
         -------
         bpi : float
             Numerator of time signature.
+
+        See also
+        --------
+        Project.time_signature
+            Get both BPM and BPI in a single call.
         """
         return self.time_signature[1]
 
@@ -234,6 +434,11 @@ class Project(ReapyObject):
         Project BPM (beats per minute).
 
         :type: float
+
+        See also
+        --------
+        Project.time_signature
+            Get both BPM and BPI in a single call.
         """
         return self.time_signature[0]
 
@@ -305,10 +510,16 @@ class Project(ReapyObject):
         return can_undo
 
     def close(self):
-        """Close project and its correspondig tab."""
-        self._filename = os.path.join(self.path, self.name)
-        with self.make_current_project():
-            reapy.perform_action(40860)
+        """
+        Close project and its correspondig tab.
+
+        If project is dirty, REAPER prompts for saving it. Project is
+        left open if the prompt is cancelled.
+        """
+        filename, is_closed = self._close()
+        if is_closed:
+            self._filename = filename
+            self._is_closed = True
 
     def current_surface_change_play_rate(self, r: float):
         """
@@ -395,16 +606,13 @@ class Project(ReapyObject):
         res = RPR.GetFocusedFX(0, 0, 0)
         if not res[0]:
             return
-        if res[1] == 0:
-            track = self.master_track
-        else:
-            track = self.tracks[res[1] - 1]
+        track_id = self._get_track_id_by_number(res[1])
         if res[0] == 1:  # Track FX
-            return track.fxs[res[3]]
+            return reapy.FX(parent_id=track_id, index=res[3])
         # Take FX
-        item = track.items[res[2]]
-        take = item.takes[res[3] // 2**16]
-        return take.fxs[res[3] % 2**16]
+        item_id = RPR.GetTrackMediaItem(track_id, res[2])
+        take_id = RPR.GetMediaItemTake(item_id, res[3] // 2**16)
+        return reapy.FX(parent_id=take_id, index=res[3] % 2**16)
 
     def get_info_string(self, param_name: str) -> str:
         """
@@ -543,9 +751,31 @@ class Project(ReapyObject):
             If key or section does not exist an empty string is returned.
         """
         value = RPR.GetProjExtState(self.id, section, key, "", 2**31 - 1)[4]
-        if value and pickled:
-            value = pickle.loads(codecs.decode(value.encode(), "base64"))
-        return value
+        return _load_ext_state(value, pickled)
+
+    def get_ext_state_batch(self, keys, pickled=False):
+        """
+        Return several external states of project in a single call.
+
+        Parameters
+        ----------
+        keys : iterable of (str, str)
+            ``(section, key)`` pairs.
+        pickled: bool
+            Whether data was pickled or not.
+
+        Returns
+        -------
+        values : list
+            Values in the same order as `keys`. If a key or section
+            does not exist an empty string is returned in its place.
+
+        See also
+        --------
+        Project.get_ext_state
+        """
+        values = self._get_ext_states([list(k) for k in keys])
+        return [_load_ext_state(value, pickled) for value in values]
 
     def glue_items(self, within_time_selection=False):
         """
@@ -565,10 +795,13 @@ class Project(ReapyObject):
         Whether ReaScript ID is still valid.
 
         For instance, if project has been closed, ID will not be valid
-        anymore.
+        anymore. After Project.close, this is known without asking
+        REAPER.
 
         :type: bool
         """
+        if self._is_closed:
+            return False
         return bool(RPR.ValidatePtr(*self._get_pointer_and_name()))
 
     @property
@@ -588,8 +821,7 @@ class Project(ReapyObject):
 
         :type: bool
         """
-        is_current = self == Project()
-        return is_current
+        return RPR.EnumProjects(-1, None, 0)[0] == self.id
 
     @property
     def is_paused(self):
@@ -598,7 +830,7 @@ class Project(ReapyObject):
 
         :type: bool
         """
-        return bool(RPR.GetPlayStateEx(self.id) & 2)
+        return self.play_state[1]
 
     @property
     def is_playing(self):
@@ -607,7 +839,7 @@ class Project(ReapyObject):
 
         :type: bool
         """
-        return bool(RPR.GetPlayStateEx(self.id) & 1)
+        return self.play_state[0]
 
     @property
     def is_recording(self):
@@ -616,9 +848,8 @@ class Project(ReapyObject):
 
         :type: bool
         """
-        return bool(RPR.GetPlayStateEx(self.id) & 4)
+        return self.play_state[2]
 
-    @reapy.inside_reaper()
     @property
     def is_stopped(self):
         """
@@ -626,9 +857,9 @@ class Project(ReapyObject):
 
         :type: bool
         """
-        return not self.is_playing and not self.is_paused
+        is_playing, is_paused, _ = self.play_state
+        return not is_playing and not is_paused
 
-    @reapy.inside_reaper()
     @property
     def items(self):
         """
@@ -636,9 +867,7 @@ class Project(ReapyObject):
 
         :type: list of Item
         """
-        n_items = self.n_items
-        item_ids = [RPR.GetMediaItem(self.id, i) for i in range(n_items)]
-        return list(map(reapy.Item, item_ids))
+        return list(map(reapy.Item, self._get_item_ids()))
 
     @property
     def length(self):
@@ -678,11 +907,9 @@ class Project(ReapyObject):
             if not res[0]:
                 fx, index = None, None
             else:
-                if res[1]:
-                    track = self.tracks[res[1] - 1]
-                else:
-                    track = self.master_track
-                fx, index = track.fxs[res[2]], res[3]
+                track_id = self._get_track_id_by_number(res[1])
+                fx = reapy.FX(parent_id=track_id, index=res[2])
+                index = res[3]
         return fx, index
 
     def make_current_project(self):
@@ -718,11 +945,8 @@ class Project(ReapyObject):
 
         :type: list of reapy.Marker
         """
-        ids = [
-            RPR.EnumProjectMarkers2(self.id, i, 0, 0, 0, 0, 0)
-            for i in range(self.n_regions + self.n_markers)
-        ]
-        return [reapy.Marker(self, i[0]) for i in ids if not i[3]]
+        marker_ids, _ = self._enumerate_markers_regions()
+        return [reapy.Marker(self, i) for i in marker_ids]
 
     @property
     def master_track(self):
@@ -731,9 +955,10 @@ class Project(ReapyObject):
 
         :type: Track
         """
-        track_id = RPR.GetMasterTrack(self.id)
-        master_track = reapy.Track(track_id)
-        return master_track
+        if self._master_track is None:
+            track_id = RPR.GetMasterTrack(self.id)
+            self._master_track = reapy.Track(track_id)
+        return self._master_track
 
     @reapy.inside_reaper()
     def mute_all_tracks(self, mute=True):
@@ -769,8 +994,7 @@ class Project(ReapyObject):
 
         :type: int
         """
-        n_markers = RPR.CountProjectMarkers(self.id, 0, 0)[2]
-        return n_markers
+        return self._marker_region_counts()[0]
 
     @property
     def n_regions(self):
@@ -779,8 +1003,7 @@ class Project(ReapyObject):
 
         :type: int
         """
-        n_regions = RPR.CountProjectMarkers(self.id, 0, 0)[3]
-        return n_regions
+        return self._marker_region_counts()[1]
 
     @property
     def n_selected_items(self):
@@ -849,6 +1072,8 @@ class Project(ReapyObject):
         if self._filename is None:
             raise RuntimeError("project hasn't been closed")
         self.id = reapy.open_project(self._filename, in_new_tab).id
+        self._is_closed = False
+        self._master_track = None
 
     def pause(self):
         """
@@ -883,6 +1108,22 @@ class Project(ReapyObject):
         """
         RPR.OnPlayButtonEx(self.id)
 
+    @property
+    def play_state(self):
+        """
+        Whether project is playing, paused and recording.
+
+        All three flags are retrieved with a single distant call.
+
+        :type: (bool, bool, bool)
+
+        Examples
+        --------
+        >>> is_playing, is_paused, is_recording = project.play_state
+        """
+        state = RPR.GetPlayStateEx(self.id)
+        return bool(state & 1), bool(state & 2), bool(state & 4)
+
     @property
     def play_position(self):
         """
@@ -939,11 +1180,8 @@ class Project(ReapyObject):
 
         :type: list of reapy.Region
         """
-        ids = [
-            RPR.EnumProjectMarkers2(self.id, i, 0, 0, 0, 0, 0)
-            for i in range(self.n_regions + self.n_markers)
-        ]
-        return [reapy.Region(self, i[0]) for i in ids if i[3]]
+        _, region_ids = self._enumerate_markers_regions()
+        return [reapy.Region(self, i) for i in region_ids]
 
     def save(self, force_save_as=False):
         """
@@ -989,7 +1227,6 @@ class Project(ReapyObject):
         envelope = None if envelope_id == 0 else reapy.Envelope(envelope_id)
         return envelope
 
-    @reapy.inside_reaper()
     @property
     def selected_items(self):
         """
@@ -1002,10 +1239,7 @@ class Project(ReapyObject):
         Project.get_selected_item
             Return a specific selected item.
         """
-        return [
-            reapy.Item(RPR.GetSelectedMediaItem(self.id, i))
-            for i in range(self.n_selected_items)
-        ]
+        return list(map(reapy.Item, self._get_selected_item_ids()))
 
     @reapy.inside_reaper()
     @property
@@ -1111,17 +1345,37 @@ class Project(ReapyObject):
         ValueError
             If dumped `value` has length over 2**31 - 2.
         """
-        if pickled:
-            value = pickle.dumps(value)
-            value = codecs.encode(value, "base64").decode()
-        if len(value) > 2**31 - 2:
-            message = (
-                "Dumped value length is {:,d}. It must not be over "
-                "2**31 - 2."
-            )
-            raise ValueError(message.format(len(value)))
+        value = _dump_ext_state(value, pickled)
         RPR.SetProjExtState(self.id, section, key, value)
 
+    def set_ext_state_batch(self, states, pickled=False):
+        """
+        Set several external states of project in a single call.
+
+        Parameters
+        ----------
+        states : iterable of (str, str, Union[Any, str])
+            ``(section, key, value)`` triplets. Values are dumped as in
+            Project.set_ext_state.
+        pickled : bool, optional
+            Whether values should be pickled.
+
+        Raises
+        ------
+        ValueError
+            If a dumped value has length over 2**31 - 2. In that case
+            no state is set.
+
+        See also
+        --------
+        Project.set_ext_state
+        """
+        states = [
+            [section, key, _dump_ext_state(value, pickled)]
+            for section, key, value in states
+        ]
+        self._set_ext_states(states)
+
     @reapy.inside_reaper()
     def solo_all_tracks(self):
         """
@@ -1213,6 +1467,35 @@ class Project(ReapyObject):
         beats = RPR.TimeMap2_timeToQN(self.id, time)
         return beats
 
+    def time_to_beats_batch(self, times, as_array=False):
+        """
+        Convert several times in seconds to beats.
+
+        All times are converted in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        as_array : bool, optional
+            Whether to return a ``numpy.ndarray`` of dtype ``float64``
+            instead of a list (default=False). Requires ``numpy``.
+
+        Returns
+        -------
+        beats : list of float or numpy.ndarray
+            Times in beats.
+
+        See also
+        --------
+        Project.beats_to_time_batch
+        Project.time_to_beats
+        """
+        beats = self._times_to_beats(list(map(float, times)))
+        if as_array:
+            beats = _arrays.as_float_array(beats)
+        return beats
+
     @property
     def tracks(self):
         """
@@ -1258,10 +1541,57 @@ class Project(ReapyObject):
             RPR.SoloAllTracks(0)
 
 
+class _BoundedBytesIO(io.BytesIO):
+
+    """Bytes buffer that refuses to grow over `max_size` bytes."""
+
+    def __init__(self, max_size):
+        super().__init__()
+        self.max_size = max_size
+
+    def write(self, b):
+        if self.tell() + memoryview(b).nbytes > self.max_size:
+            raise ValueError(
+                "Dumped value length must not be over 2**31 - 2."
+            )
+        return super().write(b)
+
+
+def _dump_ext_state(value, pickled):
+    """Return ext state `value` as stored in REAPER."""
+    if pickled:
+        # Base64 turns every 3 bytes into 4 characters
+        buffer = _BoundedBytesIO(3 * ((2**31 - 2) // 4))
+        pickle.dump(value, buffer, pickle.HIGHEST_PROTOCOL)
+        value = base64.b64encode(buffer.getvalue()).decode()
+    if len(value) > 2**31 - 2:
+        message = (
+            "Dumped value length is {:,d}. It must not be over "
+            "2**31 - 2."
+        )
+        raise ValueError(message.format(len(value)))
+    return value
+
+
+def _load_ext_state(value, pickled):
+    """Return ext state `value` as read from REAPER."""
+    if value and pickled:
+        value = pickle.loads(base64.b64decode(value))
+    return value
+
+
+def _with_name_and_color(spec, n_positions):
+    """Pad marker or region `spec` with default name and color."""
+    spec = tuple(spec)
+    return spec + ("", 0)[len(spec) - n_positions:]
+
+
 class _MakeCurrentProject:
 
     """Context manager used by Project.make_current_project."""
 
+    __slots__ = ("current_project",)
+
     def __init__(self, project):
         self.current_project = self._make_current_project(project)
 
@@ -1277,6 +1607,11 @@ class _MakeCurrentProject:
         pass
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Test for valid ID in case project has been closed since __enter__
-        if self.current_project.has_valid_id:
-            self.current_project.make_current_project()
+        self._restore_project(self.current_project)
+
+    @staticmethod
+    @reapy.inside_reaper()
+    def _restore_project(project):
+        """Select `project` again, unless it has been closed since."""
+        if project.has_valid_id:
+            RPR.SelectProjectInstance(project.id)
@@ -1,5 +1,7 @@
 """Defines class Project."""
 
+import io
+
 import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
@@ -12,6 +14,8 @@ class Project(ReapyObject):
     """REAPER project."""
     id: str
     _filename: str
+    _is_closed: bool
+    _master_track: ty.Optional[reapy.Track]
 
     def __init__(self,
                  id: ty.Optional[ty.Union[int, str]] = None,
@@ -40,6 +44,41 @@ class Project(ReapyObject):
     def _args(self) -> ty.Tuple[str]:
         ...
 
+    @reapy.inside_reaper()
+    def _add_markers_regions(
+        self, specs: ty.List[ty.Tuple[bool, float, float, str, ty.Any]]
+    ) -> ty.List[int]:
+        """Add markers or regions from normalized specs, return indices."""
+        ...
+
+    @reapy.inside_reaper()
+    def _beats_to_times(self, beats: ty.List[float]) -> ty.List[float]:
+        """Convert list of times in beats to seconds."""
+        ...
+
+    @reapy.inside_reaper()
+    def _close(self) -> ty.Tuple[str, bool]:
+        """
+        Close project and return its file path and whether it closed.
+
+        Closing a dirty project prompts for saving, and the user can
+        cancel it, in which case the project stays open.
+        """
+        ...
+
+    @reapy.inside_reaper()
+    def _enumerate_markers_regions(
+        self
+    ) -> ty.Tuple[ty.List[int], ty.List[int]]:
+        """
+        Return marker and region IDs with a single enumeration.
+
+        Returns
+        -------
+        marker_ids, region_ids : list of int, list of int
+        """
+        ...
+
     @staticmethod
     def _from_name(name: str) -> 'Project':
         """Return project with corresponding name.
@@ -61,8 +100,50 @@ class Project(ReapyObject):
         """
         ...
 
-    def _get_track_by_name(self, name: str) -> ty.Optional[reapy.Track]:
-        """Return first track with matching name."""
+    @reapy.inside_reaper()
+    def _get_ext_states(
+        self, keys: ty.List[ty.List[str]]
+    ) -> ty.List[str]:
+        """Return raw ext state values for ``(section, key)`` pairs."""
+        ...
+
+    @reapy.inside_reaper()
+    def _get_item_ids(self) -> ty.List[str]:
+        """Return ReaScript IDs of all items in project."""
+        ...
+
+    @staticmethod
+    @reapy.inside_reaper()
+    def _get_project_id_by_name(name: str) -> ty.Optional[str]:
+        """Return ID of first project named `name`, or None."""
+        ...
+
+    @reapy.inside_reaper()
+    def _get_selected_item_ids(self) -> ty.List[str]:
+        """Return ReaScript IDs of selected items in project."""
+        ...
+
+    @reapy.inside_reaper()
+    def _get_track_id_by_name(self, name: str) -> ty.Optional[str]:
+        """Return ID of first track named `name`, or None."""
+        ...
+
+    def _get_track_id_by_number(self, number: int) -> str:
+        """Return ID of track `number` as numbered in GUI (0 is master)."""
+        ...
+
+    def _marker_region_counts(self) -> ty.Tuple[int, int]:
+        """Return numbers of markers and regions in project."""
+        ...
+
+    @reapy.inside_reaper()
+    def _set_ext_states(self, states: ty.List[ty.List[str]]) -> None:
+        """Set raw ext state values from ``(section, key, value)``."""
+        ...
+
+    @reapy.inside_reaper()
+    def _times_to_beats(self, times: ty.List[float]) -> ty.List[float]:
+        """Convert list of times in seconds to beats."""
         ...
 
     def add_marker(self,
@@ -95,6 +176,30 @@ class Project(ReapyObject):
         """
         ...
 
+    def add_markers(
+        self,
+        markers: ty.Iterable[ty.Tuple[ty.Any, ...]]
+    ) -> ty.List[reapy.Marker]:
+        """
+        Create several markers in a single distant call.
+
+        Parameters
+        ----------
+        markers : iterable of tuple
+            Each tuple is ``(position[, name[, color]])``, with the
+            same meaning and defaults as in Project.add_marker.
+
+        Returns
+        -------
+        markers : list of reapy.Marker
+            New markers.
+
+        See also
+        --------
+        Project.add_marker
+        """
+        ...
+
     def add_region(self,
                    start: float,
                    end: float,
@@ -122,7 +227,35 @@ class Project(ReapyObject):
         """
         ...
 
-    def add_track(self, index: int = 0, name: str = "") -> reapy.Track:
+    def add_regions(
+        self,
+        regions: ty.Iterable[ty.Tuple[ty.Any, ...]]
+    ) -> ty.List[reapy.Region]:
+        """
+        Create several regions in a single distant call.
+
+        Parameters
+        ----------
+        regions : iterable of tuple
+            Each tuple is ``(start, end[, name[, color]])``, with the
+            same meaning and defaults as in Project.add_region.
+
+        Returns
+        -------
+        regions : list of reapy.Region
+            New regions.
+
+        See also
+        --------
+        Project.add_region
+        """
+        ...
+
+    def add_track(self,
+                  index: int = 0,
+                  name: str = "",
+                  rec_arm: bool = False,
+                  rec_input: ty.Optional[int] = None) -> reapy.Track:
         """
         Add track at a specified index.
 
@@ -132,6 +265,12 @@ class Project(ReapyObject):
             Index at which to insert track.
         name : str, optional
             Name of created track.
+        rec_arm : bool, optional
+            Whether to arm created track for recording (default=False).
+        rec_input : int or None, optional
+            Record input of created track (see ``I_RECINPUT`` in
+            ``Track.set_info_value``). If None (default), REAPER
+            default input is kept.
 
         Returns
         -------
@@ -172,6 +311,36 @@ class Project(ReapyObject):
         """
         ...
 
+    def beats_to_time_batch(
+        self,
+        beats: ty.Iterable[float],
+        as_array: bool = False
+    ) -> ty.Union[ty.List[float], ty.Any]:
+        """
+        Convert several times in beats to seconds.
+
+        All times are converted in a single distant call.
+
+        Parameters
+        ----------
+        beats : iterable of float
+            Times in beats. A ``numpy.ndarray`` is accepted.
+        as_array : bool, optional
+            Whether to return a ``numpy.ndarray`` of dtype ``float64``
+            instead of a list (default=False). Requires ``numpy``.
+
+        Returns
+        -------
+        times : list of float or numpy.ndarray
+            Converted times in seconds.
+
+        See also
+        --------
+        Project.beats_to_time
+        Project.time_to_beats_batch
+        """
+        ...
+
     def begin_undo_block(self) -> None:
         """
         Start a new undo block.
@@ -187,6 +356,11 @@ class Project(ReapyObject):
         -------
         bpi : float
             Numerator of time signature.
+
+        See also
+        --------
+        Project.time_signature
+            Get both BPM and BPI in a single call.
         """
         ...
 
@@ -196,6 +370,11 @@ class Project(ReapyObject):
         Project BPM (beats per minute).
 
         :type: float
+
+        See also
+        --------
+        Project.time_signature
+            Get both BPM and BPI in a single call.
         """
         ...
 
@@ -255,7 +434,12 @@ class Project(ReapyObject):
         ...
 
     def close(self) -> None:
-        """Colse project and its correspondig tab."""
+        """
+        Close project and its correspondig tab.
+
+        If project is dirty, REAPER prompts for saving it. Project is
+        left open if the prompt is cancelled.
+        """
         ...
 
     def current_surface_change_play_rate(self, r: float) -> None:
@@ -374,6 +558,33 @@ class Project(ReapyObject):
 
         ...
 
+    def get_ext_state_batch(
+        self,
+        keys: ty.Iterable[ty.Tuple[str, str]],
+        pickled: bool = False
+    ) -> ty.List[ty.Union[str, object]]:
+        """
+        Return several external states of project in a single call.
+
+        Parameters
+        ----------
+        keys : iterable of (str, str)
+            ``(section, key)`` pairs.
+        pickled: bool
+            Whether data was pickled or not.
+
+        Returns
+        -------
+        values : list
+            Values in the same order as `keys`. If a key or section
+            does not exist an empty string is returned in its place.
+
+        See also
+        --------
+        Project.get_ext_state
+        """
+        ...
+
     def get_play_rate(self, position: float) -> float:
         """
         Return project play rate at a given position.
@@ -443,7 +654,8 @@ class Project(ReapyObject):
         """Whether ReaScript ID is still valid.
 
         For instance, if project has been manually closed, ID will not
-        be valid anymore.
+        be valid anymore. After Project.close, this is known without
+        asking REAPER.
 
         :type: bool
         """
@@ -721,6 +933,21 @@ class Project(ReapyObject):
         """
         ...
 
+    @property
+    def play_state(self) -> ty.Tuple[bool, bool, bool]:
+        """
+        Whether project is playing, paused and recording.
+
+        All three flags are retrieved with a single distant call.
+
+        :type: (bool, bool, bool)
+
+        Examples
+        --------
+        >>> is_playing, is_paused, is_recording = project.play_state
+        """
+        ...
+
     @property
     def play_position(self) -> float:
         """
@@ -936,6 +1163,34 @@ class Project(ReapyObject):
     def set_ext_state(self, section: str, key: str, value: str,
                       pickled: bool = False) -> int: ...
 
+    def set_ext_state_batch(
+        self,
+        states: ty.Iterable[ty.Tuple[str, str, ty.Any]],
+        pickled: bool = False
+    ) -> None:
+        """
+        Set several external states of project in a single call.
+
+        Parameters
+        ----------
+        states : iterable of (str, str, Union[Any, str])
+            ``(section, key, value)`` triplets. Values are dumped as in
+            Project.set_ext_state.
+        pickled : bool, optional
+            Whether values should be pickled.
+
+        Raises
+        ------
+        ValueError
+            If a dumped value has length over 2**31 - 2. In that case
+            no state is set.
+
+        See also
+        --------
+        Project.set_ext_state
+        """
+        ...
+
     def solo_all_tracks(self) -> None:
         """
         Solo all tracks in project.
@@ -1021,6 +1276,36 @@ class Project(ReapyObject):
         """
         ...
 
+    def time_to_beats_batch(
+        self,
+        times: ty.Iterable[float],
+        as_array: bool = False
+    ) -> ty.Union[ty.List[float], ty.Any]:
+        """
+        Convert several times in seconds to beats.
+
+        All times are converted in a single distant call.
+
+        Parameters
+        ----------
+        times : iterable of float
+            Times in seconds. A ``numpy.ndarray`` is accepted.
+        as_array : bool, optional
+            Whether to return a ``numpy.ndarray`` of dtype ``float64``
+            instead of a list (default=False). Requires ``numpy``.
+
+        Returns
+        -------
+        beats : list of float or numpy.ndarray
+            Times in beats.
+
+        See also
+        --------
+        Project.beats_to_time_batch
+        Project.time_to_beats
+        """
+        ...
+
     @property
     def tracks(self) -> reapy.TrackList:
         """
@@ -1062,6 +1347,33 @@ class Project(ReapyObject):
         ...
 
 
+class _BoundedBytesIO(io.BytesIO):
+    """Bytes buffer that refuses to grow over `max_size` bytes."""
+    max_size: int
+
+    def __init__(self, max_size: int) -> None:
+        ...
+
+    def write(self, b: ty.Any) -> int:
+        ...
+
+
+def _dump_ext_state(value: ty.Any, pickled: bool) -> str:
+    """Return ext state `value` as stored in REAPER."""
+    ...
+
+
+def _load_ext_state(value: str, pickled: bool) -> ty.Union[str, object]:
+    """Return ext state `value` as read from REAPER."""
+    ...
+
+
+def _with_name_and_color(spec: ty.Iterable[ty.Any],
+                         n_positions: int) -> ty.Tuple[ty.Any, ...]:
+    """Pad marker or region `spec` with default name and color."""
+    ...
+
+
 class _MakeCurrentProject:
     """Context manager used by Project.make_current_project."""
     current_project: Project
@@ -1075,3 +1387,9 @@ class _MakeCurrentProject:
     def __exit__(self, exc_type: ty.Any, exc_val: ty.Any,
                  exc_tb: ty.Any) -> None:
         ...
+
+    @staticmethod
+    @reapy.inside_reaper()
+    def _restore_project(project: Project) -> None:
+        """Select `project` again, unless it has been closed since."""
+        ...
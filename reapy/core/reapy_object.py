@@ -16,6 +16,8 @@ class ReapyObject(metaclass=ReapyMetaclass):
 
     """Base class for reapy objects."""
 
+    __slots__ = ()
+
     def __eq__(self, other):
         return repr(self) == repr(other)
 
@@ -66,4 +68,4 @@ class ReapyObjectList(ReapyObject):
 
     """Abstract class for list of ReapyObjects."""
 
-    pass
+    __slots__ = ()
@@ -1,4 +1,4 @@
-from .automation_item import AutomationItem
+from .automation_item import AutomationItem, AutomationItemList
 from .info import TrackSendInfo, MediaInfo
 from .send import Send
 from .track import Track, TrackList
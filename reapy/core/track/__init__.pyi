@@ -1,9 +1,10 @@
-from .automation_item import AutomationItem
+from .automation_item import AutomationItem, AutomationItemList
 from .info import TrackSendInfo, MediaInfo
 from .send import Send
 from .track import Track, TrackList
 __all__ = [
     'AutomationItem',
+    'AutomationItemList',
     'MediaInfo',
     'Send',
     'Track',
@@ -1,5 +1,5 @@
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
 
 
 class AutomationItem(ReapyObject):
@@ -130,3 +130,47 @@ class AutomationItem(ReapyObject):
         success = RPR.GetSetAutomationItemInfo(
             self.envelope_id, self.index, "D_POSITION", position, True
         )
+
+
+class AutomationItemList(ReapyObjectList):
+
+    """
+    Container class for the list of automation items in an envelope.
+
+    Automation items are only instantiated when accessed, and the
+    number of items is retrieved once when the list is created.
+
+    Examples
+    --------
+    >>> items = envelope.items
+    >>> len(items)
+    2
+    >>> items[0]
+    AutomationItem(index=0, envelope_id="(TrackEnvelope*)0x0000000006CDEBE0")
+    """
+
+    def __init__(self, envelope, n_items=None):
+        self.envelope = envelope
+        if n_items is None:
+            n_items = envelope.n_items
+        self.n_items = n_items
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if not -self.n_items <= key < self.n_items:
+            raise IndexError(
+                "{} has only {} items".format(self.envelope, self.n_items)
+            )
+        return AutomationItem(self.envelope, key % self.n_items)
+
+    def __len__(self):
+        return self.n_items
+
+    @property
+    def _args(self):
+        return self.envelope,
+
+    @property
+    def _kwargs(self):
+        return {"n_items": self.n_items}
@@ -1,5 +1,5 @@
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
 from reapy import Envelope
 import typing as ty
 from typing_extensions import TypedDict
@@ -117,3 +117,49 @@ class AutomationItem(ReapyObject):
             New item position in seconds.
         """
         ...
+
+
+class AutomationItemList(ReapyObjectList):
+    """
+    Container class for the list of automation items in an envelope.
+
+    Automation items are only instantiated when accessed, and the
+    number of items is retrieved once when the list is created.
+
+    Examples
+    --------
+    >>> items = envelope.items
+    >>> len(items)
+    2
+    >>> items[0]
+    AutomationItem(index=0, envelope_id="(TrackEnvelope*)0x0000000006CDEBE0")
+    """
+    envelope: Envelope
+    n_items: int
+
+    def __init__(self,
+                 envelope: Envelope,
+                 n_items: ty.Optional[int] = None) -> None:
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: int) -> AutomationItem:
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: slice) -> ty.List[AutomationItem]:
+        ...
+
+    def __getitem__(self, key):
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def _args(self) -> ty.Tuple[Envelope]:
+        ...
+
+    @property
+    def _kwargs(self) -> ty.Dict[str, int]:
+        ...
@@ -12,7 +12,7 @@ class TrackSendInfo():
     SEND_MODE = "I_SENDMODE" # 0=post-fader, 1=pre-fx, 2=post-fx (deprecated), 3=post-fx
     AUTO_MODE = "I_AUTOMODE" # automation mode (-1=use track automode, 0=trim/off, 1=read, 2=touch, 3=write, 4=latch)
     SOURCE_CHANNEL = "I_SRCCHAN" # Source channel index,&1024=mono, -1 for none
-    DESTINATION_CHANNEL = "" # Destination channel index, &1024=mono, otherwise stereo pair, hwout:&512=rearoute
+    DESTINATION_CHANNEL = "I_DSTCHAN" # Destination channel index, &1024=mono, otherwise stereo pair, hwout:&512=rearoute
     MIDI_FLAG = "I_MIDIFLAGS" # low 5 bits=source channel 0=all, 1-16, next 5 bits=dest channel, 0=orig, 1-16=chan
 
 
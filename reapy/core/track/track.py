@@ -4,6 +4,46 @@ from reapy.core import ReapyObject, ReapyObjectList
 from reapy.errors import InvalidObjectError, UndefinedEnvelopeError
 
 
+_AUTOMATION_MODES = (
+    "trim/read", "read", "touch", "write", "latch", "latch preview"
+)
+_AUTOMATION_MODE_INDICES = {m: i for i, m in enumerate(_AUTOMATION_MODES)}
+
+# Shared by the docstrings of Track.get_info_value and
+# Track.set_info_value.
+_INFO_VALUE_NAMES = """\
+            B_MUTE : bool * : muted (item solo overrides). setting this value will clear C_MUTE_SOLO.
+            B_MUTE_ACTUAL : bool * : muted (ignores solo). setting this value will not affect C_MUTE_SOLO.
+            C_MUTE_SOLO : char * : solo override (-1=soloed, 0=no override, 1=unsoloed). note that this API does not automatically unsolo other items when soloing (nor clear the unsolos when clearing the last soloed item), it must be done by the caller via action or via this API.
+            B_LOOPSRC : bool * : loop source
+            B_ALLTAKESPLAY : bool * : all takes play
+            B_UISEL : bool * : selected in arrange view
+            C_BEATATTACHMODE : char * : item timebase, -1=track or project default, 1=beats (position, length, rate), 2=beats (position only). for auto-stretch timebase: C_BEATATTACHMODE=1, C_AUTOSTRETCH=1
+            C_AUTOSTRETCH: : char * : auto-stretch at project tempo changes, 1=enabled, requires C_BEATATTACHMODE=1
+            C_LOCK : char * : locked, &1=locked
+            D_VOL : double * : item volume, 0=-inf, 0.5=-6dB, 1=+0dB, 2=+6dB, etc
+            D_POSITION : double * : item position in seconds
+            D_LENGTH : double * : item length in seconds
+            D_SNAPOFFSET : double * : item snap offset in seconds
+            D_FADEINLEN : double * : item manual fadein length in seconds
+            D_FADEOUTLEN : double * : item manual fadeout length in seconds
+            D_FADEINDIR : double * : item fadein curvature, -1..1
+            D_FADEOUTDIR : double * : item fadeout curvature, -1..1
+            D_FADEINLEN_AUTO : double * : item auto-fadein length in seconds, -1=no auto-fadein
+            D_FADEOUTLEN_AUTO : double * : item auto-fadeout length in seconds, -1=no auto-fadeout
+            C_FADEINSHAPE : int * : fadein shape, 0..6, 0=linear
+            C_FADEOUTSHAPE : int * : fadeout shape, 0..6, 0=linear
+            I_GROUPID : int * : group ID, 0=no group
+            I_LASTY : int * : Y-position (relative to top of track) in pixels (read-only)
+            I_LASTH : int * : height in pixels (read-only)
+            I_CUSTOMCOLOR : int * : custom color, OS dependent color|0x1000000 (i.e. ColorToNative(r,g,b)|0x1000000). If you do not |0x1000000, then it will not be used, but will store the color
+            I_CURTAKE : int * : active take number
+            IP_ITEMNUMBER : int : item number on this track (read-only, returns the item number directly)
+            F_FREEMODE_Y : float * : free item positioning Y-position, 0=top of track, 1=bottom of track (will never be 1)
+            F_FREEMODE_H : float * : free item positioning height, 0=no height, 1=full height of track (will never be 0)
+            P_TRACK : MediaTrack * : (read-only)"""
+
+
 class Track(ReapyObject):
 
     """
@@ -43,7 +83,12 @@ class Track(ReapyObject):
     Track("(MediaTrack*)0x00000000110A1AD0")
     """
 
+    __slots__ = ("id", "_envelopes", "_fxs", "_guid", "_project")
+
     def __init__(self, id, project=None):
+        self._envelopes = None
+        self._fxs = None
+        self._guid = None
         self._project = None
         if isinstance(id, int):  # id is a track index
             id = RPR.GetTrack(project.id, id)
@@ -53,20 +98,32 @@ class Track(ReapyObject):
         elif isinstance(id, str) and not id.startswith("(MediaTrack*)"):
             # id is a track name
             name = id
-            id = project._get_track_by_name(name).id
-            if id.endswith("0x0000000000000000"):
+            id = project._get_track_id_by_name(name)
+            if id is None:
                 raise KeyError(name)
             self._project = project
         # id is now a real ReaScript ID
         self.id = id
 
+    def __eq__(self, other):
+        return isinstance(other, Track) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
     @property
     def _args(self):
         return self.id,
 
     @classmethod
     def _get_id_from_pointer(cls, pointer):
-        return '(MediaTrack*)0x{0:0{1}X}'.format(int(pointer), 16)
+        return '(MediaTrack*)0x{:016X}'.format(int(pointer))
+
+    @reapy.inside_reaper()
+    def _get_item_ids(self):
+        """Return ReaScript IDs of all items on track."""
+        n_items = RPR.CountTrackMediaItems(self.id)
+        return [RPR.GetTrackMediaItem(self.id, i) for i in range(n_items)]
 
     @reapy.inside_reaper()
     def _get_project(self):
@@ -76,10 +133,52 @@ class Track(ReapyObject):
         Should only be used internally; one should directly access
         Track.project instead of calling this method.
         """
+        pointer, name = self._get_pointer_and_name()
         for project in reapy.get_projects():
-            if self.id in [t.id for t in project.tracks]:
+            if RPR.ValidatePtr2(project.id, pointer, name):
                 return project
 
+    @reapy.inside_reaper()
+    def _is_valid_in_project(self, project_id):
+        """
+        Return whether track ID is valid in project `project_id`.
+
+        If `project_id` is None, look for the track in all open projects.
+        """
+        pointer, name = self._get_pointer_and_name()
+        if project_id is not None:
+            return bool(RPR.ValidatePtr2(project_id, pointer, name))
+        return any(
+            RPR.ValidatePtr2(p.id, pointer, name)
+            for p in reapy.get_projects()
+        )
+
+    @property
+    def _known_project_id(self):
+        """ID of parent project if it is already known, else None."""
+        return None if self._project is None else self._project.id
+
+    @reapy.inside_reaper()
+    def _perform_action_alone(self, action_id, project_id=None):
+        """
+        Perform action with track as only selected track.
+
+        `project_id` is the ID of the parent project. If None, it is
+        looked for among all open projects. Track selection of parent
+        project is restored afterwards.
+        """
+        if project_id is None:
+            project_id = self.project.id
+        n_selected = RPR.CountSelectedTracks2(project_id, False)
+        selected_ids = [
+            RPR.GetSelectedTrack(project_id, i) for i in range(n_selected)
+        ]
+        RPR.SetOnlyTrackSelected(self.id)
+        RPR.Main_OnCommandEx(action_id, 0, project_id)
+        RPR.Main_OnCommandEx(40297, 0, project_id)  # Unselect all tracks
+        for track_id in selected_ids:
+            RPR.SetTrackSelected(track_id, True)
+
     def add_audio_accessor(self):
         """
         Create audio accessor and return it.
@@ -210,9 +309,7 @@ class Track(ReapyObject):
 
         :type: str
         """
-        modes = "trim/read", "read", "touch", "write", "latch", "latch preview"
-        automation_mode = modes[RPR.GetTrackAutomationMode(self.id)]
-        return automation_mode
+        return _AUTOMATION_MODES[RPR.GetTrackAutomationMode(self.id)]
 
     @automation_mode.setter
     def automation_mode(self, mode):
@@ -230,8 +327,11 @@ class Track(ReapyObject):
                 "trim/read"
                 "write"
         """
-        modes = "trim/read", "read", "touch", "write", "latch", "latch preview"
-        RPR.SetTrackAutomationMode(self.id, modes.index(mode))
+        try:
+            index = _AUTOMATION_MODE_INDICES[mode]
+        except KeyError:
+            raise ValueError("Unknown automation mode: {!r}".format(mode))
+        RPR.SetTrackAutomationMode(self.id, index)
 
     @property
     def color(self):
@@ -258,6 +358,32 @@ class Track(ReapyObject):
         native_color = reapy.rgb_to_native(color)
         RPR.SetTrackColor(self.id, native_color)
 
+    @reapy.inside_reaper()
+    @property
+    def counts(self):
+        """
+        Numbers of envelopes, FXs, items, sends and receives on track.
+
+        All six counts are retrieved with a single distant call. Keys
+        are the names of the matching ``Track.n_*`` properties.
+
+        :type: dict of str to int
+
+        Examples
+        --------
+        >>> counts = track.counts
+        >>> counts["n_items"] == track.n_items
+        True
+        """
+        return {
+            "n_envelopes": self.n_envelopes,
+            "n_fxs": self.n_fxs,
+            "n_hardware_sends": self.n_hardware_sends,
+            "n_items": self.n_items,
+            "n_receives": self.n_receives,
+            "n_sends": self.n_sends,
+        }
+
     def delete(self):
         """
         Delete track.
@@ -279,19 +405,28 @@ class Track(ReapyObject):
         """
         List of envelopes on track.
 
+        The list is a view on the track: it is built once per Track
+        object and always reflects current envelopes.
+
         :type: EnvelopeList
         """
-        return reapy.EnvelopeList(self)
+        if self._envelopes is None:
+            self._envelopes = reapy.EnvelopeList(self)
+        return self._envelopes
 
     @property
     def fxs(self):
         """
         List of FXs on track.
 
+        The list is a view on the track: it is built once per Track
+        object and always reflects current FXs.
+
         :type: FXList
         """
-        fxs = reapy.FXList(self)
-        return fxs
+        if self._fxs is None:
+            self._fxs = reapy.FXList(self)
+        return self._fxs
 
     def get_info_string(self, param_name):
         return RPR.GetSetMediaTrackInfo_String(self.id, param_name, "", False)[3]
@@ -303,36 +438,7 @@ class Track(ReapyObject):
         Parameters:
         ----------
         param_name : str
-            B_MUTE : bool * : muted (item solo overrides). setting this value will clear C_MUTE_SOLO.
-            B_MUTE_ACTUAL : bool * : muted (ignores solo). setting this value will not affect C_MUTE_SOLO.
-            C_MUTE_SOLO : char * : solo override (-1=soloed, 0=no override, 1=unsoloed). note that this API does not automatically unsolo other items when soloing (nor clear the unsolos when clearing the last soloed item), it must be done by the caller via action or via this API.
-            B_LOOPSRC : bool * : loop source
-            B_ALLTAKESPLAY : bool * : all takes play
-            B_UISEL : bool * : selected in arrange view
-            C_BEATATTACHMODE : char * : item timebase, -1=track or project default, 1=beats (position, length, rate), 2=beats (position only). for auto-stretch timebase: C_BEATATTACHMODE=1, C_AUTOSTRETCH=1
-            C_AUTOSTRETCH: : char * : auto-stretch at project tempo changes, 1=enabled, requires C_BEATATTACHMODE=1
-            C_LOCK : char * : locked, &1=locked
-            D_VOL : double * : item volume, 0=-inf, 0.5=-6dB, 1=+0dB, 2=+6dB, etc
-            D_POSITION : double * : item position in seconds
-            D_LENGTH : double * : item length in seconds
-            D_SNAPOFFSET : double * : item snap offset in seconds
-            D_FADEINLEN : double * : item manual fadein length in seconds
-            D_FADEOUTLEN : double * : item manual fadeout length in seconds
-            D_FADEINDIR : double * : item fadein curvature, -1..1
-            D_FADEOUTDIR : double * : item fadeout curvature, -1..1
-            D_FADEINLEN_AUTO : double * : item auto-fadein length in seconds, -1=no auto-fadein
-            D_FADEOUTLEN_AUTO : double * : item auto-fadeout length in seconds, -1=no auto-fadeout
-            C_FADEINSHAPE : int * : fadein shape, 0..6, 0=linear
-            C_FADEOUTSHAPE : int * : fadeout shape, 0..6, 0=linear
-            I_GROUPID : int * : group ID, 0=no group
-            I_LASTY : int * : Y-position (relative to top of track) in pixels (read-only)
-            I_LASTH : int * : height in pixels (read-only)
-            I_CUSTOMCOLOR : int * : custom color, OS dependent color|0x1000000 (i.e. ColorToNative(r,g,b)|0x1000000). If you do not |0x1000000, then it will not be used, but will store the color
-            I_CURTAKE : int * : active take number
-            IP_ITEMNUMBER : int : item number on this track (read-only, returns the item number directly)
-            F_FREEMODE_Y : float * : free item positioning Y-position, 0=top of track, 1=bottom of track (will never be 1)
-            F_FREEMODE_H : float * : free item positioning height, 0=no height, 1=full height of track (will never be 0)
-            P_TRACK : MediaTrack * : (read-only)
+{info_value_names}
         Returns:
         -------
         value : int, float, str
@@ -341,6 +447,11 @@ class Track(ReapyObject):
         value = RPR.GetMediaTrackInfo_Value(self.id, param_name)
         return value
 
+    if get_info_value.__doc__ is not None:  # Stripped with -OO
+        get_info_value.__doc__ = get_info_value.__doc__.format(
+            info_value_names=_INFO_VALUE_NAMES
+        )
+
     @property
     def GUID(self):
         """
@@ -348,16 +459,19 @@ class Track(ReapyObject):
 
         16-byte GUID, can query or update.
         If using a _String() function, GUID is a string {xyz-...}.
+        It is only queried once per Track object, unless it is set
+        through that object.
 
         :type: str
         """
-        return RPR.GetTrackGUID(self.id)
+        if self._guid is None:
+            self._guid = RPR.GetTrackGUID(self.id)
+        return self._guid
 
     @GUID.setter
     def GUID(self, guid_string):
         self.set_info_string("GUID", guid_string)
 
-    @reapy.inside_reaper()
     @property
     def has_valid_id(self):
         """
@@ -368,13 +482,7 @@ class Track(ReapyObject):
 
         :type: bool
         """
-        pointer, name = self._get_pointer_and_name()
-        if self._project is None:
-            return any(
-                RPR.ValidatePtr2(p.id, pointer, name)
-                for p in reapy.get_projects()
-            )
-        return bool(RPR.ValidatePtr2(self.project.id, pointer, name))
+        return self._is_valid_in_project(self._known_project_id)
 
     @property
     def icon(self):
@@ -421,7 +529,6 @@ class Track(ReapyObject):
         instrument = None if fx_index == -1 else reapy.FX(self, fx_index)
         return instrument
 
-    @reapy.inside_reaper()
     @property
     def items(self):
         """
@@ -429,11 +536,7 @@ class Track(ReapyObject):
 
         :type: list of Item
         """
-        n_items = RPR.CountTrackMediaItems(self.id)
-        item_ids = [
-            RPR.GetTrackMediaItem(self.id, i) for i in range(n_items)
-        ]
-        return list(map(reapy.Item, item_ids))
+        return list(map(reapy.Item, self._get_item_ids()))
 
     @property
     def is_muted(self):
@@ -512,13 +615,10 @@ class Track(ReapyObject):
         """
         return RPR.MIDI_GetTrackHash(self.id, notes_only, 'hash', 1024**2)[3]
 
+    @reapy.inside_reaper()
     @property
     def midi_note_names(self):
-        with reapy.inside_reaper():
-            names = [
-                RPR.GetTrackMIDINoteName(self.id, i, 0) for i in range(128)
-            ]
-        return names
+        return [RPR.GetTrackMIDINoteName(self.id, i, 0) for i in range(128)]
 
     @reapy.inside_reaper()
     def mute(self):
@@ -617,11 +717,11 @@ class Track(ReapyObject):
             self._project = self._get_project()
         return self._project
 
-    @reapy.inside_reaper()
     @property
     def receives(self):
         return [
-            reapy.Send(self, i, type="receive") for i in range(self.n_receives)
+            reapy.Send(track_id=self.id, index=i, type="receive")
+            for i in range(self.n_receives)
         ]
 
     def recarm_change(self, recarm: int):
@@ -643,14 +743,16 @@ class Track(ReapyObject):
         """
         RPR.SetTrackSelected(self.id, True)
 
-    @reapy.inside_reaper()
     @property
     def sends(self):
         return [
-            reapy.Send(self, i, type="send") for i in range(self.n_sends)
+            reapy.Send(track_id=self.id, index=i, type="send")
+            for i in range(self.n_sends)
         ]
 
     def set_info_string(self, param_name, param_string):
+        if param_name == "GUID":
+            self._guid = None
         RPR.GetSetMediaTrackInfo_String(
             self.id, param_name, param_string, True)
 
@@ -662,61 +764,30 @@ class Track(ReapyObject):
         ----------
         param_name : str
             Parameter name.
-            B_MUTE : bool * : muted (item solo overrides). setting this value will clear C_MUTE_SOLO.
-            B_MUTE_ACTUAL : bool * : muted (ignores solo). setting this value will not affect C_MUTE_SOLO.
-            C_MUTE_SOLO : char * : solo override (-1=soloed, 0=no override, 1=unsoloed). note that this API does not automatically unsolo other items when soloing (nor clear the unsolos when clearing the last soloed item), it must be done by the caller via action or via this API.
-            B_LOOPSRC : bool * : loop source
-            B_ALLTAKESPLAY : bool * : all takes play
-            B_UISEL : bool * : selected in arrange view
-            C_BEATATTACHMODE : char * : item timebase, -1=track or project default, 1=beats (position, length, rate), 2=beats (position only). for auto-stretch timebase: C_BEATATTACHMODE=1, C_AUTOSTRETCH=1
-            C_AUTOSTRETCH: : char * : auto-stretch at project tempo changes, 1=enabled, requires C_BEATATTACHMODE=1
-            C_LOCK : char * : locked, &1=locked
-            D_VOL : double * : item volume, 0=-inf, 0.5=-6dB, 1=+0dB, 2=+6dB, etc
-            D_POSITION : double * : item position in seconds
-            D_LENGTH : double * : item length in seconds
-            D_SNAPOFFSET : double * : item snap offset in seconds
-            D_FADEINLEN : double * : item manual fadein length in seconds
-            D_FADEOUTLEN : double * : item manual fadeout length in seconds
-            D_FADEINDIR : double * : item fadein curvature, -1..1
-            D_FADEOUTDIR : double * : item fadeout curvature, -1..1
-            D_FADEINLEN_AUTO : double * : item auto-fadein length in seconds, -1=no auto-fadein
-            D_FADEOUTLEN_AUTO : double * : item auto-fadeout length in seconds, -1=no auto-fadeout
-            C_FADEINSHAPE : int * : fadein shape, 0..6, 0=linear
-            C_FADEOUTSHAPE : int * : fadeout shape, 0..6, 0=linear
-            I_GROUPID : int * : group ID, 0=no group
-            I_LASTY : int * : Y-position (relative to top of track) in pixels (read-only)
-            I_LASTH : int * : height in pixels (read-only)
-            I_CUSTOMCOLOR : int * : custom color, OS dependent color|0x1000000 (i.e. ColorToNative(r,g,b)|0x1000000). If you do not |0x1000000, then it will not be used, but will store the color
-            I_CURTAKE : int * : active take number
-            IP_ITEMNUMBER : int : item number on this track (read-only, returns the item number directly)
-            F_FREEMODE_Y : float * : free item positioning Y-position, 0=top of track, 1=bottom of track (will never be 1)
-            F_FREEMODE_H : float * : free item positioning height, 0=no height, 1=full height of track (will never be 0)
+{info_value_names}
         param_value : bool, int or float
             Parameter value.
         """
         RPR.SetMediaTrackInfo_Value(self.id, param_name, param_value)
 
+    if set_info_value.__doc__ is not None:  # Stripped with -OO
+        set_info_value.__doc__ = set_info_value.__doc__.format(
+            info_value_names=_INFO_VALUE_NAMES
+        )
+
     @reapy.inside_reaper()
     def solo(self):
         """Solo track (do nothing if track is already solo)."""
         if not self.is_solo:
             self.toggle_solo()
 
-    @reapy.inside_reaper()
     def toggle_mute(self):
         """Toggle mute on track."""
-        selected_tracks = self.project.selected_tracks
-        self.make_only_selected_track()
-        self.project.perform_action(40280)
-        self.project.selected_tracks = selected_tracks
+        self._perform_action_alone(40280, self._known_project_id)
 
-    @reapy.inside_reaper()
     def toggle_solo(self):
         """Toggle solo on track."""
-        selected_tracks = self.project.selected_tracks
-        self.make_only_selected_track()
-        self.project.perform_action(7)
-        self.project.selected_tracks = selected_tracks
+        self._perform_action_alone(7, self._known_project_id)
 
     @reapy.inside_reaper()
     def unmute(self):
@@ -752,6 +823,11 @@ class TrackList(ReapyObjectList):
     """
     Container for a project's track list.
 
+    The list holds no track IDs: it always reflects the current
+    tracks of its project, and each integer index costs one distant
+    call. Slicing and iterating fetch all requested tracks in a
+    single distant call.
+
     Examples
     --------
     >>> tracks = project.tracks
@@ -766,8 +842,11 @@ class TrackList(ReapyObjectList):
     'Snare'
     'Hi-hat'
     'Cymbal"
+    >>> kick, snare = tracks[:2]  # Single distant call
     """
 
+    __slots__ = ("parent",)
+
     def __init__(self, parent):
         """
         Create track list.
@@ -802,7 +881,54 @@ class TrackList(ReapyObjectList):
     def _args(self):
         return self.parent,
 
-    @reapy.inside_reaper()
     def _get_items_from_slice(self, slice):
-        indices = range(*slice.indices(len(self)))
-        return [self[i] for i in indices]
+        ids = self._get_track_ids(slice.start, slice.stop, slice.step)
+        return list(map(Track, ids))
+
+    @reapy.inside_reaper()
+    def _get_track_ids(self, start, stop, step):
+        """Return IDs of tracks in ``range(start, stop, step)``."""
+        project_id = self.parent.id
+        n_tracks = RPR.CountTracks(project_id)
+        indices = range(*slice(start, stop, step).indices(n_tracks))
+        return [RPR.GetTrack(project_id, i) for i in indices]
+
+    @reapy.inside_reaper()
+    def get_info_values(self, param_name):
+        """
+        Return a numerical-value attribute of all tracks.
+
+        All values are read in a single distant call.
+
+        Parameters
+        ----------
+        param_name : str
+            Parameter name, as in Track.get_info_value (e.g. ``"B_MUTE"``,
+            ``"I_SOLO"`` or ``"D_VOL"``).
+
+        Returns
+        -------
+        values : list of float
+            Values in track order.
+
+        See also
+        --------
+        Track.get_info_value
+        """
+        return [
+            RPR.GetMediaTrackInfo_Value(track_id, param_name)
+            for track_id in self._get_track_ids(None, None, None)
+        ]
+
+    @reapy.inside_reaper()
+    @property
+    def names(self):
+        """
+        Names of all tracks, read in a single distant call.
+
+        :type: list of str
+        """
+        return [
+            RPR.GetTrackName(track_id, "", 2048)[2]
+            for track_id in self._get_track_ids(None, None, None)
+        ]
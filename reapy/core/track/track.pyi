@@ -43,6 +43,9 @@ class Track(ReapyObject):
     Track("(MediaTrack*)0x00000000110A1AD0")
     """
     id: str
+    _envelopes: ty.Optional[reapy.EnvelopeList]
+    _fxs: ty.Optional[reapy.FXList]
+    _guid: ty.Optional[str]
     _project: reapy.Project
 
     def __init__(
@@ -52,6 +55,12 @@ class Track(ReapyObject):
     ) -> None:
         ...
 
+    def __eq__(self, other: object) -> bool:
+        ...
+
+    def __hash__(self) -> int:
+        ...
+
     @property
     def _args(self) -> ty.Tuple[ty.Union[str, int]]:
         ...
@@ -60,6 +69,11 @@ class Track(ReapyObject):
     def _get_id_from_pointer(cls, id_: ty.Union[int, float]) -> str:
         ...
 
+    @reapy.inside_reaper()
+    def _get_item_ids(self) -> ty.List[str]:
+        """Return ReaScript IDs of all items on track."""
+        ...
+
     def _get_project(self) -> reapy.Project:
         """
         Return parent project of track.
@@ -69,6 +83,33 @@ class Track(ReapyObject):
         """
         ...
 
+    @reapy.inside_reaper()
+    def _is_valid_in_project(self, project_id: ty.Optional[str]) -> bool:
+        """
+        Return whether track ID is valid in project `project_id`.
+
+        If `project_id` is None, look for the track in all open projects.
+        """
+        ...
+
+    @property
+    def _known_project_id(self) -> ty.Optional[str]:
+        """ID of parent project if it is already known, else None."""
+        ...
+
+    @reapy.inside_reaper()
+    def _perform_action_alone(
+        self, action_id: int, project_id: ty.Optional[str] = None
+    ) -> None:
+        """
+        Perform action with track as only selected track.
+
+        `project_id` is the ID of the parent project. If None, it is
+        looked for among all open projects. Track selection of parent
+        project is restored afterwards.
+        """
+        ...
+
     def add_audio_accessor(self) -> reapy.AudioAccessor:
         """
         Create audio accessor and return it.
@@ -231,6 +272,24 @@ class Track(ReapyObject):
         """
         ...
 
+    @property
+    def counts(self) -> ty.Dict[str, int]:
+        """
+        Numbers of envelopes, FXs, items, sends and receives on track.
+
+        All six counts are retrieved with a single distant call. Keys
+        are the names of the matching ``Track.n_*`` properties.
+
+        :type: dict of str to int
+
+        Examples
+        --------
+        >>> counts = track.counts
+        >>> counts["n_items"] == track.n_items
+        True
+        """
+        ...
+
     def delete(self) -> None:
         """
         Delete track.
@@ -251,6 +310,9 @@ class Track(ReapyObject):
         """
         List of envelopes on track.
 
+        The list is a view on the track: it is built once per Track
+        object and always reflects current envelopes.
+
         :type: EnvelopeList
         """
         ...
@@ -260,6 +322,9 @@ class Track(ReapyObject):
         """
         List of FXs on track.
 
+        The list is a view on the track: it is built once per Track
+        object and always reflects current FXs.
+
         :type: FXList
         """
         ...
@@ -277,6 +342,8 @@ class Track(ReapyObject):
 
         16-byte GUID, can query or update.
         If using a _String() function, GUID is a string {xyz-...}.
+        It is only queried once per Track object, unless it is set
+        through that object.
 
         :type: str
         """
@@ -558,6 +625,11 @@ class TrackList(ReapyObjectList):
     """
     Container for a project's track list.
 
+    The list holds no track IDs: it always reflects the current
+    tracks of its project, and each integer index costs one distant
+    call. Slicing and iterating fetch all requested tracks in a
+    single distant call.
+
     Examples
     --------
     >>> tracks = project.tracks
@@ -572,6 +644,7 @@ class TrackList(ReapyObjectList):
     'Snare'
     'Hi-hat'
     'Cymbal"
+    >>> kick, snare = tracks[:2]  # Single distant call
     """
     parent: reapy.Project
 
@@ -613,3 +686,45 @@ class TrackList(ReapyObjectList):
 
     def _get_items_from_slice(self, slice: slice) -> ty.List[Track]:
         ...
+
+    @reapy.inside_reaper()
+    def _get_track_ids(
+        self,
+        start: ty.Optional[int],
+        stop: ty.Optional[int],
+        step: ty.Optional[int]
+    ) -> ty.List[str]:
+        """Return IDs of tracks in ``range(start, stop, step)``."""
+        ...
+
+    def get_info_values(self, param_name: str) -> ty.List[float]:
+        """
+        Return a numerical-value attribute of all tracks.
+
+        All values are read in a single distant call.
+
+        Parameters
+        ----------
+        param_name : str
+            Parameter name, as in Track.get_info_value (e.g. ``"B_MUTE"``,
+            ``"I_SOLO"`` or ``"D_VOL"``).
+
+        Returns
+        -------
+        values : list of float
+            Values in track order.
+
+        See also
+        --------
+        Track.get_info_value
+        """
+        ...
+
+    @property
+    def names(self) -> ty.List[str]:
+        """
+        Names of all tracks, read in a single distant call.
+
+        :type: list of str
+        """
+        ...
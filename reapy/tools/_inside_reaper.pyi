@@ -53,6 +53,16 @@ class inside_reaper(contextlib.ContextDecorator):
     ...     for x in range(n):
     ...         reapy.Project().add_track()
 
+    Inside ``reapy`` modules, it can also decorate a property. It must
+    then be placed above ``@property``, so that it receives the
+    property object and makes its getter, setter and deleter each run
+    in a single distant call:
+
+    >>> @reapy.inside_reaper()
+    ... @property
+    ... def has_valid_id(self):
+    ...     ...
+
     """
 
     def __call__(self,  # type:ignore
@@ -1,3 +1,5 @@
+import threading
+
 from reapy.errors import DisconnectedClientError, DistError
 from reapy.tools import json
 from .socket import Socket
@@ -5,8 +7,17 @@ from .socket import Socket
 
 class Client(Socket):
 
+    """
+    Client part of the ``reapy`` dist API.
+
+    A single connection to the server is kept open for the client
+    lifetime. Requests are serialized with a lock so that several
+    threads can share it.
+    """
+
     def __init__(self, port, host="localhost"):
         super().__init__()
+        self._lock = threading.Lock()
         self._connect(port, host)
         self.port, self.host = port, host
 
@@ -21,8 +32,9 @@ class Client(Socket):
     def request(self, function, input=None):
         request = {"function": function, "input": input}
         request = json.dumps(request).encode()
-        self.send(request)
-        result = self._get_result()
+        with self._lock:
+            self.send(request)
+            result = self._get_result()
         if result["type"] == "result":
             return result["value"]
         elif result["type"] == "error":
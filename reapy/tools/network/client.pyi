@@ -1,3 +1,5 @@
+import threading
+
 from reapy.errors import DisconnectedClientError, DistError
 from reapy.tools import json
 from .socket import Socket
@@ -5,6 +7,14 @@ import typing as ty
 
 
 class Client(Socket):
+    """
+    Client part of the ``reapy`` dist API.
+
+    A single connection to the server is kept open for the client
+    lifetime. Requests are serialized with a lock so that several
+    threads can share it.
+    """
+    _lock: threading.Lock
     address: str
     port: int
     host: str